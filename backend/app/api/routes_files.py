@@ -1,18 +1,46 @@
 """
 FastAPI routes for serving PDF files and static assets.
 """
+import io
 import os
+import tempfile
 from pathlib import Path
 from fastapi import APIRouter, HTTPException, Request
 from fastapi.responses import FileResponse, StreamingResponse
 from fastapi.staticfiles import StaticFiles
 from typing import Optional
 
+try:
+    from reportlab.lib.pagesizes import LETTER
+    from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer
+    from reportlab.lib.styles import getSampleStyleSheet
+    REPORTLAB_AVAILABLE = True
+except ImportError:
+    REPORTLAB_AVAILABLE = False
+
 router = APIRouter(prefix="/files", tags=["files"])
 
 # Serve static files from artifacts directory
 ARTIFACTS_DIR = Path(os.getenv("ARTIFACT_DIR", "backend/artifacts"))
 
+# Sample PDF content as (style, text) rows; a None style inserts a spacer.
+# The feature bullets are one <br/>-joined paragraph so reportlab parses and wraps them once.
+_SAMPLE_PDF_FEATURES = [
+    "PDF rendering",
+    "SVG overlay functionality",
+    "HiL (Highlight in Line) annotations",
+    "Page navigation",
+    "Annotation management",
+]
+_SAMPLE_PDF_OUTLINE = [
+    ("Title", "Sample PDF for WebViewer Testing"),
+    (None, None),
+    ("Normal", "This is a sample PDF document created for testing the Apryse WebViewer integration."),
+    (None, None),
+    ("Heading2", "Features to test:"),
+    ("Normal", "<br/>".join(f"• {f}" for f in _SAMPLE_PDF_FEATURES)),
+]
+
 @router.get("/{filename}")
 async def serve_file(filename: str, request: Request):
     """
@@ -37,8 +65,8 @@ async def serve_file(filename: str, request: Request):
     # For large files (>10MB), use streaming
     if file_size > 10 * 1024 * 1024:  # 10MB
         def iter_file():
-            with open(file_path, "rb") as f:
-                while chunk := f.read(8192):
+            with open(file_path, "rb", buffering=0) as f:
+                while chunk := f.read(1024 * 1024):  # 1 MB chunks
                     yield chunk
         
         return StreamingResponse(
@@ -69,38 +97,36 @@ async def serve_sample_pdf():
     
     if not sample_path.exists():
         # Create a simple sample PDF using reportlab
-        try:
-            from reportlab.lib.pagesizes import LETTER
-            from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer
-            from reportlab.lib.styles import getSampleStyleSheet
-            
-            # Ensure artifacts directory exists
-            sample_path.parent.mkdir(parents=True, exist_ok=True)
-            
-            # Create sample PDF
-            doc = SimpleDocTemplate(str(sample_path), pagesize=LETTER)
-            styles = getSampleStyleSheet()
-            story = []
-            
-            # Add content
-            story.append(Paragraph("Sample PDF for WebViewer Testing", styles['Title']))
-            story.append(Spacer(1, 12))
-            story.append(Paragraph("This is a sample PDF document created for testing the Apryse WebViewer integration.", styles['Normal']))
-            story.append(Spacer(1, 12))
-            story.append(Paragraph("Features to test:", styles['Heading2']))
-            story.append(Paragraph("• PDF rendering", styles['Normal']))
-            story.append(Paragraph("• SVG overlay functionality", styles['Normal']))
-            story.append(Paragraph("• HiL (Highlight in Line) annotations", styles['Normal']))
-            story.append(Paragraph("• Page navigation", styles['Normal']))
-            story.append(Paragraph("• Annotation management", styles['Normal']))
-            
-            doc.build(story)
-            
-        except ImportError:
+        if not REPORTLAB_AVAILABLE:
             raise HTTPException(
                 status_code=500, 
                 detail="ReportLab not available. Please install with: pip install reportlab"
             )
+        
+        # Ensure artifacts directory exists
+        sample_path.parent.mkdir(parents=True, exist_ok=True)
+        
+        # Create sample PDF in memory, then write it out in one call
+        buf = io.BytesIO()
+        doc = SimpleDocTemplate(buf, pagesize=LETTER)
+        styles = getSampleStyleSheet()
+        story = [
+            Paragraph(text, styles[style]) if style else Spacer(1, 12)
+            for style, text in _SAMPLE_PDF_OUTLINE
+        ]
+        
+        doc.build(story)
+        
+        # write-then-rename so a concurrent request never serves a partial file;
+        # the temp name is unique per call so two first requests cannot collide
+        fd, tmp_name = tempfile.mkstemp(dir=sample_path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(buf.getvalue())
+            os.replace(tmp_name, sample_path)
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
     
     return FileResponse(
         path=str(sample_path),
@@ -5,6 +5,7 @@ from sqlalchemy import and_
 from typing import List, Optional
 import uuid
 import csv
+import io
 from datetime import datetime
 from pathlib import Path
 
@@ -92,33 +93,27 @@ async def commit_review(
         # Ensure reports directory exists
         settings.get_reports_dir().mkdir(parents=True, exist_ok=True)
         
-        # Write CSV
-        with open(csv_path, 'w', newline='', encoding='utf-8') as csvfile:
-            fieldnames = [
-                'file', 'page', 'type', 'x_pdf', 'y_pdf', 'x_ft', 'y_ft', 'confidence'
-            ]
-            writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-            writer.writeheader()
+        # Write CSV: serialize in memory, then hand the encoded bytes to the OS in one write
+        buf = io.StringIO(newline='')
+        writer = csv.writer(buf)
+        writer.writerow([
+            'file', 'page', 'type', 'x_pdf', 'y_pdf', 'x_ft', 'y_ft', 'confidence'
+        ])
+        
+        for item in accepted_items:
+            # Convert PDF coordinates to feet
+            x_ft = item.x_pdf / ppf
+            y_ft = item.y_pdf / ppf
             
-            for item in accepted_items:
-                # Convert PDF coordinates to feet
-                x_ft = item.x_pdf / ppf
-                y_ft = item.y_pdf / ppf
-                
-                # Use edited coordinates if available
-                x_pdf = item.x_pdf_edited if item.x_pdf_edited is not None else item.x_pdf
-                y_pdf = item.y_pdf_edited if item.y_pdf_edited is not None else item.y_pdf
-                
-                writer.writerow({
-                    'file': item.file,
-                    'page': item.page,
-                    'type': item.type,
-                    'x_pdf': x_pdf,
-                    'y_pdf': y_pdf,
-                    'x_ft': x_ft,
-                    'y_ft': y_ft,
-                    'confidence': item.confidence
-                })
+            # Use edited coordinates if available
+            x_pdf = item.x_pdf_edited if item.x_pdf_edited is not None else item.x_pdf
+            y_pdf = item.y_pdf_edited if item.y_pdf_edited is not None else item.y_pdf
+            
+            writer.writerow([
+                item.file, item.page, item.type, x_pdf, y_pdf, x_ft, y_ft, item.confidence
+            ])
+        
+        csv_path.write_bytes(buf.getvalue().encode('utf-8'))
         
         # Step 6: Create/update ReviewSession
         session_id = str(uuid.uuid4())
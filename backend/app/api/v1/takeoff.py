@@ -2,6 +2,7 @@ from fastapi import APIRouter, Query, HTTPException
 from pydantic import BaseModel
 from typing import List, Dict, Tuple
 import os, math
+from functools import lru_cache
 
 from backend.app.services.ingest import get_ingestor
 from backend.app.domain.dto import PageVectors, VectorPath, TextToken
@@ -46,8 +47,9 @@ def _nearby_tokens(line_pts: List[Tuple[float,float]], tokens: List[TextToken],
             out.append(t)
     return out
 
+@lru_cache(maxsize=1024)
 def _parse_dia_material(text: str) -> Tuple[int | None, str | None]:
-    # crude regex-free MVP
+    # crude regex-free MVP; cached because the same label is re-parsed for every nearby path
     dia = None; mat = None
     s = text.upper().replace("INCH","\"")
     for k in ["4","6","8","10","12","16","20","24","30","36"]:
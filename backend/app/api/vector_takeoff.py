@@ -1,7 +1,7 @@
 from __future__ import annotations
 from fastapi import APIRouter, UploadFile, File, HTTPException, Query
 from pydantic import BaseModel
-import tempfile, shutil, math
+import tempfile, shutil, math, re
 from typing import List, Optional, Literal, Dict, Any
 
 from backend.vpdf.extract import extract_lines
@@ -386,6 +386,10 @@ async def debug_extraction(
     except Exception as e:
         return {"ok": False, "error": str(e)}
 
+# First number in a profile label ("EG 102.5", "INV=98.25"), compiled once for every text element
+_PROFILE_NUMBER_RE = re.compile(r'\d+(?:\.\d+)?')
+_PROFILE_VALUE_KEYWORDS = ("eg", "inv", "elevation", "grade", "depth")
+
 def extract_profile_data(all_sheets_data):
     """Extract profile/section data from all sheets."""
     profile_data = {
@@ -400,18 +404,17 @@ def extract_profile_data(all_sheets_data):
             text_lower = text.text.lower()
             
             # Look for elevation data (EG, INV, etc.)
-            if any(keyword in text_lower for keyword in ["eg", "inv", "elevation", "grade", "depth"]):
-                # Extract numeric values
-                import re
-                numbers = re.findall(r'(\d+(?:\.\d+)?)', text.text)
-                if numbers:
+            if any(keyword in text_lower for keyword in _PROFILE_VALUE_KEYWORDS):
+                # Only the first number is used, so stop scanning at it
+                number = _PROFILE_NUMBER_RE.search(text.text)
+                if number:
                     # Try to associate with nearby utilities
                     nearby_utility = find_nearby_utility(sheet_data, text)
                     if nearby_utility:
                         if "eg" in text_lower or "elevation" in text_lower:
-                            profile_data["elevations"][nearby_utility] = float(numbers[0])
+                            profile_data["elevations"][nearby_utility] = float(number.group())
                         elif "inv" in text_lower or "depth" in text_lower:
-                            profile_data["depths"][nearby_utility] = float(numbers[0])
+                            profile_data["depths"][nearby_utility] = float(number.group())
             
             # Look for utility labels
             if any(keyword in text_lower for keyword in ["sanitary", "storm", "water", "sewer", "drain"]):
@@ -449,16 +452,31 @@ def find_nearby_utility(sheet_data, text):
     
     return closest_utility
 
+# Keyword tables in priority order; the first entry with a matching keyword wins.
+_UTILITY_KEYWORDS = (
+    ("sanitary", ("sanitary", "sewer")),
+    ("storm", ("storm", "drain")),
+    ("water", ("water", "h2o")),
+)
+
+_PAGE_TYPE_KEYWORDS = (
+    ("cover", ("cover", "title", "index")),
+    ("site_plan", ("site plan", "overall", "plan view")),
+    ("utility_plan", ("utility", "sewer", "storm", "water")),
+    ("profile", ("profile", "section", "elevation", "eg", "inv")),
+    ("detail", ("detail", "section", "typical")),
+)
+
+def _match_keyword_table(text_lower, table, default=None):
+    """Return the tag of the first table row with a keyword contained in text_lower."""
+    for tag, keywords in table:
+        if any(keyword in text_lower for keyword in keywords):
+            return tag
+    return default
+
 def classify_utility_from_text(text):
     """Classify utility type from text content."""
-    text_lower = text.lower()
-    if any(word in text_lower for word in ["sanitary", "sewer"]):
-        return "sanitary"
-    elif any(word in text_lower for word in ["storm", "drain"]):
-        return "storm"
-    elif any(word in text_lower for word in ["water", "h2o"]):
-        return "water"
-    return None
+    return _match_keyword_table(text.lower(), _UTILITY_KEYWORDS)
 
 def merge_profile_data(lines, areas, pipe_depths, profile_data):
     """Merge profile data with main classification results."""
@@ -481,18 +499,20 @@ def analyze_all_pdf_pages(pdf_path: str) -> List[tuple]:
     for page_idx in range(len(doc)):
         try:
             page_data = extract_lines(pdf_path, page_idx)
+            # Lowercase the page text once and share it across the classifiers below
+            texts_lower = _lowered_texts(page_data)
             
             # Analyze page content to determine page type
-            page_type = classify_page_type(page_data)
+            page_type = classify_page_type(page_data, texts_lower)
             page_metadata = {
                 "page_index": page_idx,
                 "page_type": page_type,
                 "line_count": len(page_data.lines),
                 "text_count": len(page_data.texts),
                 "area_count": len(page_data.filled_rects),
-                "has_scale": detect_scale_in_page(page_data),
-                "has_utilities": detect_utilities_in_page(page_data),
-                "has_profiles": detect_profiles_in_page(page_data)
+                "has_scale": detect_scale_in_page(page_data, texts_lower),
+                "has_utilities": detect_utilities_in_page(page_data, texts_lower),
+                "has_profiles": detect_profiles_in_page(page_data, texts_lower)
             }
             
             all_pages_data.append((page_idx, page_data, page_metadata))
@@ -504,44 +524,39 @@ def analyze_all_pdf_pages(pdf_path: str) -> List[tuple]:
     doc.close()
     return all_pages_data
 
-def classify_page_type(page_data) -> str:
+def _lowered_texts(page_data) -> List[str]:
+    """Lowercased text of every text element on the page."""
+    return [text.text.lower() for text in page_data.texts]
+
+def _any_text_has_keyword(texts_lower: List[str], keywords) -> bool:
+    return any(keyword in t for t in texts_lower for keyword in keywords)
+
+def classify_page_type(page_data, texts_lower: Optional[List[str]] = None) -> str:
     """Classify what type of page this is based on content."""
-    text_content = " ".join([text.text.lower() for text in page_data.texts])
+    if texts_lower is None:
+        texts_lower = _lowered_texts(page_data)
+    text_content = " ".join(texts_lower)
     
     # Check for specific page types
-    if any(keyword in text_content for keyword in ["cover", "title", "index"]):
-        return "cover"
-    elif any(keyword in text_content for keyword in ["site plan", "overall", "plan view"]):
-        return "site_plan"
-    elif any(keyword in text_content for keyword in ["utility", "sewer", "storm", "water"]):
-        return "utility_plan"
-    elif any(keyword in text_content for keyword in ["profile", "section", "elevation", "eg", "inv"]):
-        return "profile"
-    elif any(keyword in text_content for keyword in ["detail", "section", "typical"]):
-        return "detail"
-    else:
-        return "unknown"
-
-def detect_scale_in_page(page_data) -> bool:
+    return _match_keyword_table(text_content, _PAGE_TYPE_KEYWORDS, "unknown")
+
+def detect_scale_in_page(page_data, texts_lower: Optional[List[str]] = None) -> bool:
     """Detect if page has scale information."""
-    for text in page_data.texts:
-        if any(keyword in text.text.lower() for keyword in ["scale", "1\"", "ft", "feet"]):
-            return True
-    return False
+    if texts_lower is None:
+        texts_lower = _lowered_texts(page_data)
+    return _any_text_has_keyword(texts_lower, ("scale", "1\"", "ft", "feet"))
 
-def detect_utilities_in_page(page_data) -> bool:
+def detect_utilities_in_page(page_data, texts_lower: Optional[List[str]] = None) -> bool:
     """Detect if page has utility information."""
-    for text in page_data.texts:
-        if any(keyword in text.text.lower() for keyword in ["sanitary", "storm", "water", "sewer", "utility"]):
-            return True
-    return False
+    if texts_lower is None:
+        texts_lower = _lowered_texts(page_data)
+    return _any_text_has_keyword(texts_lower, ("sanitary", "storm", "water", "sewer", "utility"))
 
-def detect_profiles_in_page(page_data) -> bool:
+def detect_profiles_in_page(page_data, texts_lower: Optional[List[str]] = None) -> bool:
     """Detect if page has profile information."""
-    for text in page_data.texts:
-        if any(keyword in text.text.lower() for keyword in ["profile", "eg", "inv", "elevation", "grade"]):
-            return True
-    return False
+    if texts_lower is None:
+        texts_lower = _lowered_texts(page_data)
+    return _any_text_has_keyword(texts_lower, ("profile", "eg", "inv", "elevation", "grade"))
 
 def find_site_plan_page(all_pages_data: List[tuple]) -> Optional[int]:
     """Find the best site plan page from all pages."""
@@ -1,8 +1,19 @@
 # backend/app/services/artifacts.py
 from __future__ import annotations
 
+import os
 from pathlib import Path
-from typing import Dict, Iterable, Tuple
+from typing import Dict, Iterable, List, Set, Tuple
+
+# Resolved once at import; these never change for the life of the process.
+_HERE = Path(__file__).resolve()
+_APP_DIR = _HERE.parents[1]        # backend/app
+_BACKEND_DIR = _HERE.parents[2]    # backend
+_REPO_ROOT = _HERE.parents[3]      # repo root
+
+_PROJECTS_BASE = _APP_DIR / "data" / "projects"
+_BACKEND_ARTIFACTS = _BACKEND_DIR / "artifacts"
+_REPO_ARTIFACTS = _REPO_ROOT / "artifacts"
 
 
 def project_root(project_id: str) -> Path:
@@ -10,8 +21,7 @@ def project_root(project_id: str) -> Path:
     Returns the canonical app-scoped project directory:
       backend/app/data/projects/{pid}
     """
-    app_dir = Path(__file__).resolve().parents[1]
-    return app_dir / "data" / "projects" / project_id
+    return _PROJECTS_BASE / project_id
 
 
 def _candidate_roots(project_id: str) -> Iterable[Tuple[str, Path]]:
@@ -22,20 +32,14 @@ def _candidate_roots(project_id: str) -> Iterable[Tuple[str, Path]]:
       3) repo_root/artifacts/{pid}          → served at /artifacts/**
     The returned prefix is the URL segment used by your StaticFiles mount.
     """
-    cur = Path(__file__).resolve()
-    app_dir = cur.parents[1]           # backend/app
-    backend_dir = cur.parents[2]       # backend
-    repo_root = cur.parents[3]         # repo root
-
     # 1) App data/projects layout (mount at /projects)
-    projects_base = app_dir / "data" / "projects"
-    yield ("projects", projects_base / project_id)
+    yield ("projects", _PROJECTS_BASE / project_id)
 
     # 2) backend/artifacts layout (mount at /artifacts)
-    yield ("artifacts", backend_dir / "artifacts" / project_id)
+    yield ("artifacts", _BACKEND_ARTIFACTS / project_id)
 
     # 3) repo_root/artifacts layout (mount at /artifacts)
-    yield ("artifacts", repo_root / "artifacts" / project_id)
+    yield ("artifacts", _REPO_ARTIFACTS / project_id)
 
 
 def _rel_from_base(prefix: str, base_dir: Path, file_path: Path) -> str:
@@ -47,6 +51,34 @@ def _rel_from_base(prefix: str, base_dir: Path, file_path: Path) -> str:
     return f"{prefix}/{file_path.relative_to(base_dir).as_posix()}"
 
 
+def _file_names(dirpath: Path) -> Set[str]:
+    """
+    Names of the regular files directly under dirpath (empty if it is missing).
+    One directory read answers every membership probe for that directory.
+    """
+    try:
+        with os.scandir(dirpath) as it:
+            return {e.name for e in it if e.is_file()}
+    except (FileNotFoundError, NotADirectoryError):
+        return set()
+
+
+def _pdfs_newest_first(dirpath: Path) -> List[Path]:
+    """
+    List *.pdf files in dirpath, most recently modified first.
+    Uses a single os.scandir pass; DirEntry caches its stat result, so each
+    file costs one stat at most instead of a glob + separate stat per sort key.
+    A missing directory yields an empty list.
+    """
+    try:
+        with os.scandir(dirpath) as it:
+            entries = [e for e in it if e.name.endswith(".pdf") and e.is_file()]
+    except (FileNotFoundError, NotADirectoryError):
+        return []
+    entries.sort(key=lambda e: e.stat().st_mtime, reverse=True)
+    return [Path(e.path) for e in entries]
+
+
 def collect_project_artifacts(project_id: str) -> Dict[str, str]:
     """
     Gather available artifacts for a project, supporting both directory layouts.
@@ -84,21 +116,25 @@ def collect_project_artifacts(project_id: str) -> Dict[str, str]:
         # Where JSON artifacts might live:
         # - app layout:   {project_dir}/artifacts/*.json
         # - alt layout:   sometimes directly under {project_dir}
+        # The fallback is only probed for names the canonical location lacked
+        # (index files such as sheet_index.json normally live there).
         json_dirs = [
             project_dir / "artifacts",
             project_dir,  # fallback if files were written directly under the project dir
         ]
 
+        remaining = json_names
         for base in json_dirs:
-            if not base.exists():
-                continue
-            for name in json_names:
-                p = base / name
-                if p.exists():
+            if not remaining:
+                break
+            present = _file_names(base)
+            for name in remaining:
+                if name in present:
                     key = name.split(".", 1)[0]  # 'takeoff.json' -> 'takeoff'
-                    out.setdefault(key, _rel_from_base(prefix, project_dir.parent, p))
+                    out.setdefault(key, _rel_from_base(prefix, project_dir.parent, base / name))
+            remaining = [name for name in remaining if name not in present]
 
-        # Bid PDFs:
+        # Bid PDFs (same canonical-first rule):
         # - app layout:   {project_dir}/artifacts/bid/*.pdf
         # - alt layout:   {project_dir}/bid/*.pdf
         bid_dirs = [
@@ -106,12 +142,13 @@ def collect_project_artifacts(project_id: str) -> Dict[str, str]:
             project_dir / "bid",
         ]
         for bdir in bid_dirs:
-            if not bdir.exists():
-                continue
-            for pdf in sorted(bdir.glob("*.pdf"), key=lambda p: p.stat().st_mtime, reverse=True):
+            pdfs = _pdfs_newest_first(bdir)
+            for pdf in pdfs:
                 # Use a stable logical key; stem is usually timestamped already
                 key = f"bid_{pdf.stem}"
                 out.setdefault(key, _rel_from_base(prefix, project_dir.parent, pdf))
+            if pdfs:
+                break
 
         # Optional docs (first PDF in docs/)
         docs_dir = project_dir / "docs"
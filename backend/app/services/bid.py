@@ -1,37 +1,125 @@
 # backend/app/services/bid.py
+import io
 import json
 import os
+import tempfile
+import threading
 import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional
-
-
+from typing import Any, Dict, List, Optional, Tuple
+from xml.sax.saxutils import escape as xml_escape
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    from reportlab.lib.pagesizes import LETTER
+    from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, LongTable, TableStyle
+    from reportlab.lib.styles import getSampleStyleSheet
+    from reportlab.lib import colors
+    REPORTLAB_AVAILABLE = True
+    _REPORTLAB_IMPORT_ERROR: Optional[ImportError] = None
+except ImportError as e:
+    REPORTLAB_AVAILABLE = False
+    _REPORTLAB_IMPORT_ERROR = e
 
 
 from ..core.paths import artifacts_root, project_dir, stage_dir
 from .overrides import get_reviewed_or_base
 
+# Dedicated pool for the three independent input loaders; kept separate from
+# core.executors.EXECUTOR so long-running pipeline jobs there cannot starve these short reads.
+_LOADER_POOL = ThreadPoolExecutor(max_workers=3, thread_name_prefix="bid-load")
+
 # Use centralized paths helper - lazy initialization
 def _get_artifact_dir():
     return artifacts_root()
 
 
 def _read_json(path: Path) -> Any:
+    # orjson parses straight from bytes, skipping the str decode; stdlib json is the fallback
+    if ORJSON_AVAILABLE:
+        return orjson.loads(path.read_bytes())
     return json.loads(path.read_text())
 
 
+# Parsed artifacts keyed by (path, mtime_ns, size), so regenerating a bid from unchanged
+# inputs skips the JSON decode; a rewritten file gets a new key and is re-read.
+_JSON_CACHE: "OrderedDict[Tuple[str, int, int], Any]" = OrderedDict()
+_JSON_CACHE_MAX = 64
+_json_cache_lock = threading.Lock()
+
+
+def _read_json_cached(path: Path) -> Any:
+    """
+    _read_json memoized on file identity. Dicts are returned as shallow copies
+    because the loaders reassign top-level keys (inclusions, items, totals).
+    """
+    st = path.stat()
+    key = (str(path), st.st_mtime_ns, st.st_size)
+    with _json_cache_lock:
+        data = _JSON_CACHE.get(key)
+        if data is not None:
+            _JSON_CACHE.move_to_end(key)
+    if data is None:
+        data = _read_json(path)
+        with _json_cache_lock:
+            _JSON_CACHE[key] = data
+            while len(_JSON_CACHE) > _JSON_CACHE_MAX:
+                _JSON_CACHE.popitem(last=False)
+    return dict(data) if isinstance(data, dict) else data
+
+
 def _latest_file(dirpath: Path, suffix: str) -> Optional[Path]:
-    if not dirpath.exists():
+    # single scandir pass: DirEntry caches its stat, so each file costs one syscall at most
+    best: Optional[str] = None
+    best_mtime = -1.0
+    try:
+        with os.scandir(dirpath) as it:
+            for entry in it:
+                if entry.name.endswith(suffix) and entry.is_file():
+                    mtime = entry.stat().st_mtime
+                    if mtime > best_mtime:
+                        best_mtime = mtime
+                        best = entry.path
+    except (FileNotFoundError, NotADirectoryError):
         return None
-    files = sorted([p for p in dirpath.glob(f"*{suffix}") if p.is_file()], key=lambda p: p.stat().st_mtime, reverse=True)
-    return files[0] if files else None
+    return Path(best) if best else None
+
+
+def _latest_base_and_reviewed(est_dir: Path) -> Tuple[Optional[Path], Optional[Path]]:
+    """Return (latest .json, latest .json other than reviewed.json) from one scandir pass."""
+    latest: Optional[str] = None
+    latest_base: Optional[str] = None
+    latest_mtime = base_mtime = -1.0
+    try:
+        with os.scandir(est_dir) as it:
+            for entry in it:
+                if not (entry.name.endswith(".json") and entry.is_file()):
+                    continue
+                mtime = entry.stat().st_mtime
+                if mtime > latest_mtime:
+                    latest_mtime = mtime
+                    latest = entry.path
+                if entry.name != "reviewed.json" and mtime > base_mtime:
+                    base_mtime = mtime
+                    latest_base = entry.path
+    except (FileNotFoundError, NotADirectoryError):
+        return None, None
+    return (Path(latest) if latest else None), (Path(latest_base) if latest_base else None)
 
 
 def _load_scope(pid: str) -> Dict[str, Any]:
     scope_dir = stage_dir(pid, "scope")
     jf = _latest_file(scope_dir, ".json")
     if jf:
-        base_data = _read_json(jf)
+        base_data = _read_json_cached(jf)
         # Use reviewed version if available, otherwise base
         if "inclusions" in base_data and base_data["inclusions"]:
             reviewed_inclusions = get_reviewed_or_base(pid, "scope", base_data["inclusions"])
@@ -40,20 +128,28 @@ def _load_scope(pid: str) -> Dict[str, Any]:
     return {"project_id": pid, "scopes": []}
 
 
+def _compute_totals(items: List[Dict[str, Any]], overhead_pct: float, profit_pct: float) -> Tuple[float, float]:
+    """Return (subtotal, total_bid) for estimate items with overhead and profit applied."""
+    subtotal = sum(item.get("total", 0) for item in items)
+    return subtotal, subtotal * _markup(overhead_pct, profit_pct)
+
+
+def _markup(overhead_pct: float, profit_pct: float) -> float:
+    return (1 + overhead_pct / 100.0) * (1 + profit_pct / 100.0)
+
+
 def _load_estimate(pid: str) -> Dict[str, Any]:
     est_dir = stage_dir(pid, "estimate")
-    jf = _latest_file(est_dir, ".json")
+    jf, latest_base = _latest_base_and_reviewed(est_dir)
     if jf:
-        base_data = _read_json(jf)
+        base_data = _read_json_cached(jf)
         
         # Check if the loaded data is a list (reviewed items) or dict (full estimate)
         if isinstance(base_data, list):
             # This is reviewed items, need to find the base estimate structure
-            base_estimate_files = [f for f in est_dir.glob("*.json") if f.name != "reviewed.json"]
-            if base_estimate_files:
-                # Get the most recent non-reviewed file
-                latest_base = sorted(base_estimate_files, key=lambda p: p.stat().st_mtime, reverse=True)[0]
-                base_data = _read_json(latest_base)
+            if latest_base is not None:
+                # Most recent non-reviewed file, found in the same directory pass
+                base_data = _read_json_cached(latest_base)
             else:
                 # No base estimate file, create minimal structure
                 base_data = {
@@ -70,11 +166,11 @@ def _load_estimate(pid: str) -> Dict[str, Any]:
             reviewed_items = get_reviewed_or_base(pid, "estimate", base_data["items"])
             base_data["items"] = reviewed_items
             # Recalculate totals with reviewed items
-            new_subtotal = sum(item.get('total', 0) for item in reviewed_items)
-            overhead_pct = float(base_data.get("overhead_pct", 10.0))
-            profit_pct = float(base_data.get("profit_pct", 5.0))
-            base_data["subtotal"] = new_subtotal
-            base_data["total_bid"] = new_subtotal * (1 + overhead_pct/100.0) * (1 + profit_pct/100.0)
+            base_data["subtotal"], base_data["total_bid"] = _compute_totals(
+                reviewed_items,
+                float(base_data.get("overhead_pct", 10.0)),
+                float(base_data.get("profit_pct", 5.0)),
+            )
         return base_data
     # Minimal empty shape
     return {
@@ -91,10 +187,39 @@ def _load_risks(pid: str) -> Dict[str, Any]:
     risk_dir = stage_dir(pid, "risk")
     jf = _latest_file(risk_dir, ".json")
     if jf:
-        return _read_json(jf)
+        return _read_json_cached(jf)
     return {"project_id": pid, "risks": []}
 
 
+@lru_cache(maxsize=1)
+def _styles():
+    """Sample stylesheet, built once and shared by every bid (styles are never mutated here)."""
+    return getSampleStyleSheet()
+
+
+@lru_cache(maxsize=1)
+def _estimate_table_style():
+    """Estimate table style, built once; Table.setStyle only reads its commands."""
+    return TableStyle([
+        ("BACKGROUND", (0, 0), (-1, 0), colors.lightgrey),
+        ("GRID", (0, 0), (-1, -1), 0.5, colors.grey),
+        ("ALIGN", (1, 1), (-1, -1), "RIGHT"),
+    ])
+
+
+# Above this many items the estimate uses LongTable, which lays out long multi-page tables faster.
+_LONG_TABLE_ROWS = 200
+
+
+def _estimate_row(it: Dict[str, Any]) -> List[str]:
+    """Format one estimate item as a table row: Description, Qty, Unit, Unit Cost, Total."""
+    get = it.get
+    qty = get("qty", 0)
+    unit_cost = get("unit_cost", 0.0)
+    total = get("total", (qty or 0) * (unit_cost or 0.0))
+    return [str(get("description", "")), f"{qty}", get("unit", ""), f"${unit_cost:,.2f}", f"${total:,.2f}"]
+
+
 def _ensure_dir(p: Path) -> None:
     p.mkdir(parents=True, exist_ok=True)
 
@@ -104,38 +229,36 @@ def build_bid_pdf(pid: str) -> str:
     Build a submission-ready Bid PDF using latest Scope, Estimate, and Risk artifacts.
     Saves to artifacts/{pid}/bid/<timestamp>.pdf and returns the absolute path.
     """
-    try:
-        from reportlab.lib.pagesizes import LETTER
-        from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle
-        from reportlab.lib.styles import getSampleStyleSheet
-        from reportlab.lib import colors
-    except ImportError as e:
-        raise RuntimeError("Missing dependency 'reportlab'. Install with: pip install reportlab") from e
+    if not REPORTLAB_AVAILABLE:
+        raise RuntimeError("Missing dependency 'reportlab'. Install with: pip install reportlab") from _REPORTLAB_IMPORT_ERROR
     
     proj_dir = project_dir(pid)
 
-    scope = _load_scope(pid)
-    estimate = _load_estimate(pid)
-    risks = _load_risks(pid)
+    # Scope, estimate and risk loads are independent file scans + JSON reads; overlap them
+    futures = [_LOADER_POOL.submit(loader, pid) for loader in (_load_scope, _load_estimate, _load_risks)]
+    scope, estimate, risks = [f.result() for f in futures]
 
     out_dir = stage_dir(pid, "bid")
-    ts = time.strftime("%Y%m%d-%H%M%S")
-    pdf_path = (out_dir / f"{ts}.pdf").resolve()
+    now = time.localtime()  # one timestamp for both the filename and the cover date
+    ts = time.strftime("%Y%m%d-%H%M%S", now)
+    # absolute() is a string join against cwd; resolve() would walk the path for symlinks
+    pdf_path = (out_dir / f"{ts}.pdf").absolute()
 
-    styles = getSampleStyleSheet()
+    styles = _styles()
     story: List[Any] = []
 
     # Cover
     story.append(Paragraph(f"Bid Proposal – Project {pid}", styles["Title"]))
-    story.append(Paragraph(time.strftime("%B %d, %Y"), styles["Normal"]))
+    story.append(Paragraph(time.strftime("%B %d, %Y", now), styles["Normal"]))
     story.append(Spacer(1, 12))
 
     # Scope
     story.append(Paragraph("Scope of Work", styles["Heading2"]))
     scopes = scope.get("scopes") or scope.get("scope") or []
     if isinstance(scopes, list) and scopes:
-        for s in scopes[:50]:  # cap long lists for MVP
-            story.append(Paragraph(f"• {s}", styles["Normal"]))
+        # one <br/>-joined Paragraph instead of one flowable per bullet; cap long lists for MVP
+        bullets = "<br/>".join(f"• {xml_escape(str(s))}" for s in scopes[:50])
+        story.append(Paragraph(bullets, styles["Normal"]))
     else:
         story.append(Paragraph("No scope details available.", styles["Italic"]))
     story.append(Spacer(1, 12))
@@ -144,30 +267,23 @@ def build_bid_pdf(pid: str) -> str:
     story.append(Paragraph("Estimate Summary", styles["Heading2"]))
     items = estimate.get("items", []) or []
     data = [["Description", "Qty", "Unit", "Unit Cost", "Total"]]
-    for it in items:
-        desc = str(it.get("description", ""))
-        qty = it.get("qty", 0)
-        unit = it.get("unit", "")
-        unit_cost = it.get("unit_cost", 0.0)
-        total = it.get("total", (qty or 0) * (unit_cost or 0.0))
-        data.append([desc, f"{qty}", unit, f"${unit_cost:,.2f}", f"${total:,.2f}"])
+    data.extend(map(_estimate_row, items))
 
     if len(data) == 1:
         story.append(Paragraph("No estimate items available.", styles["Italic"]))
     else:
-        tbl = Table(data, repeatRows=1)
-        tbl.setStyle(TableStyle([
-            ("BACKGROUND", (0, 0), (-1, 0), colors.lightgrey),
-            ("GRID", (0, 0), (-1, -1), 0.5, colors.grey),
-            ("ALIGN", (1, 1), (-1, -1), "RIGHT"),
-        ]))
+        table_cls = LongTable if len(items) > _LONG_TABLE_ROWS else Table
+        tbl = table_cls(data, repeatRows=1)
+        tbl.setStyle(_estimate_table_style())
         story.append(tbl)
 
     # Totals
     subtotal = float(estimate.get("subtotal", 0.0))
     overhead_pct = float(estimate.get("overhead_pct", 10.0))
     profit_pct = float(estimate.get("profit_pct", 5.0))
-    total_bid = float(estimate.get("total_bid", subtotal * (1 + overhead_pct/100) * (1 + profit_pct/100)))
+    # _load_estimate already set total_bid; only derive it for estimates that lack one
+    total_bid = estimate.get("total_bid")
+    total_bid = float(total_bid) if total_bid is not None else subtotal * _markup(overhead_pct, profit_pct)
 
     story.append(Spacer(1, 12))
     story.append(Paragraph(f"Subtotal: ${subtotal:,.2f}", styles["Normal"]))
@@ -187,8 +303,19 @@ def build_bid_pdf(pid: str) -> str:
     else:
         story.append(Paragraph("No material risks identified.", styles["Italic"]))
 
-    doc = SimpleDocTemplate(str(pdf_path), pagesize=LETTER)
+    # Build in memory, then write-then-rename so readers never see a partial PDF.
+    # pdf_path only has one-second resolution, so the temp name must be unique per build.
+    buf = io.BytesIO()
+    doc = SimpleDocTemplate(buf, pagesize=LETTER)
     doc.build(story)
+    fd, tmp_name = tempfile.mkstemp(dir=out_dir, suffix=".pdf.tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(buf.getvalue())
+        os.replace(tmp_name, pdf_path)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
 
     return str(pdf_path)
 
@@ -5,10 +5,18 @@ This module provides a SQLite-based job store to replace JSON file persistence.
 """
 import sqlite3
 import json
+import threading
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Dict, Optional, Any
+from typing import Dict, Iterable, Iterator, Optional, Any, Tuple
 from datetime import datetime, timezone
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 from ..core.paths import jobs_db_path
 from ..core.logging import json_logger
 
@@ -20,6 +28,45 @@ def _utcnow() -> str:
     return datetime.now(timezone.utc).isoformat()
 
 
+def _loads(raw: str) -> Any:
+    """Decode a result_json value; orjson when available (its errors subclass json.JSONDecodeError)."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+# One long-lived connection per database path, shared by the job functions below.
+# Keyed by path so a changed jobs_db_path() (tests, migrations) gets its own connection.
+_shared_conns: Dict[Path, sqlite3.Connection] = {}
+_shared_lock = threading.RLock()
+
+# SQL text is kept byte-identical between calls so sqlite3's per-connection
+# statement cache (sized by _CACHED_STATEMENTS) reuses the compiled statements.
+_CACHED_STATEMENTS = 256
+
+# Let the WAL grow to ~10k pages before auto-checkpointing so sustained job
+# updates stall less often; checkpoint_wal() truncates it when the caller is idle.
+_WAL_AUTOCHECKPOINT_PAGES = 10000
+_BUSY_TIMEOUT_MS = 5000
+
+_SQL_INSERT = """
+    INSERT INTO jobs (id, pid, status, created_at, updated_at)
+    VALUES (?, ?, ?, ?, ?)
+"""
+_SQL_UPDATE = """
+    UPDATE jobs 
+    SET status = ?, updated_at = ?, result_json = ?, error_text = ?
+    WHERE id = ?
+"""
+_SQL_GET = """
+    SELECT id, pid, status, created_at, updated_at, result_json, error_text
+    FROM jobs WHERE id = ?
+"""
+_SQL_DELETE = "DELETE FROM jobs WHERE id = ?"
+_SQL_COUNT_ALL = "SELECT COUNT(*) FROM jobs"
+_SQL_COUNT_BY_PID = "SELECT COUNT(*) FROM jobs WHERE pid = ?"
+
+
 def get_conn() -> sqlite3.Connection:
     """
     Get a database connection with proper configuration.
@@ -27,18 +74,50 @@ def get_conn() -> sqlite3.Connection:
     Returns:
         sqlite3.Connection: Configured database connection
     """
-    db_path = jobs_db_path()
+    return _open_conn(jobs_db_path())
+
+
+@contextmanager
+def _db() -> Iterator[sqlite3.Connection]:
+    """
+    Yield the shared connection for the current jobs database.
     
+    The connection is opened and configured once (PRAGMAs + schema) and then
+    reused; access is serialised with a lock and each block runs in a
+    transaction that commits on success and rolls back on error.
+    """
+    db_path = jobs_db_path()
+    with _shared_lock:
+        conn = _shared_conns.get(db_path)
+        if conn is not None and not db_path.exists():
+            # Database file was removed underneath us; start over on a fresh one
+            conn.close()
+            conn = None
+        if conn is None:
+            conn = _open_conn(db_path, check_same_thread=False)
+            _shared_conns[db_path] = conn
+        with conn:
+            yield conn
+
+
+def _open_conn(db_path: Path, check_same_thread: bool = True) -> sqlite3.Connection:
+    """Open a connection to db_path, apply PRAGMAs and ensure the schema exists."""
     # Ensure parent directory exists
     db_path.parent.mkdir(parents=True, exist_ok=True)
     
     # Connect to database
-    conn = sqlite3.connect(str(db_path))
+    conn = sqlite3.connect(
+        str(db_path),
+        check_same_thread=check_same_thread,
+        cached_statements=_CACHED_STATEMENTS,
+    )
     
     # Configure connection for better performance and reliability
     conn.execute("PRAGMA journal_mode=WAL")
     conn.execute("PRAGMA synchronous=NORMAL")
     conn.execute("PRAGMA foreign_keys=ON")
+    conn.execute(f"PRAGMA wal_autocheckpoint={_WAL_AUTOCHECKPOINT_PAGES}")
+    conn.execute(f"PRAGMA busy_timeout={_BUSY_TIMEOUT_MS}")
     
     # Set row factory to return dictionaries
     conn.row_factory = sqlite3.Row
@@ -62,6 +141,12 @@ def get_conn() -> sqlite3.Connection:
         ON jobs(pid)
     """)
     
+    # Composite index so per-project listings come back in created_at order without a sort
+    conn.execute("""
+        CREATE INDEX IF NOT EXISTS idx_jobs_pid_created 
+        ON jobs(pid, created_at DESC)
+    """)
+    
     # Create index for status lookups
     conn.execute("""
         CREATE INDEX IF NOT EXISTS idx_jobs_status 
@@ -72,6 +157,26 @@ def get_conn() -> sqlite3.Connection:
     return conn
 
 
+def checkpoint_wal() -> Tuple[int, int, int]:
+    """
+    Checkpoint the jobs database WAL and truncate it to zero bytes.
+    
+    Intended for idle periods (e.g. a periodic maintenance task) so the WAL
+    stays bounded without checkpoint work landing on the write path.
+    
+    Returns:
+        tuple: (busy, wal_pages, checkpointed_pages) as reported by SQLite
+    """
+    with _db() as conn:
+        busy, wal_pages, checkpointed = conn.execute("PRAGMA wal_checkpoint(TRUNCATE)").fetchone()
+    
+    logger.info("WAL checkpointed", extra={
+        'db_operation': 'checkpoint',
+        'result': {'busy': busy, 'wal_pages': wal_pages, 'checkpointed': checkpointed}
+    })
+    return busy, wal_pages, checkpointed
+
+
 def create_job(job_id: str, pid: str, status: str, created_at: str) -> None:
     """
     Create a new job record in the database.
@@ -82,11 +187,8 @@ def create_job(job_id: str, pid: str, status: str, created_at: str) -> None:
         status: Job status
         created_at: Creation timestamp (ISO8601)
     """
-    with get_conn() as conn:
-        conn.execute("""
-            INSERT INTO jobs (id, pid, status, created_at, updated_at)
-            VALUES (?, ?, ?, ?, ?)
-        """, (job_id, pid, status, created_at, created_at))
+    with _db() as conn:
+        conn.execute(_SQL_INSERT, (job_id, pid, status, created_at, created_at))
         conn.commit()
     
     logger.info("Job created", extra={
@@ -114,12 +216,8 @@ def update_job(
         result_json: Optional JSON result data
         error_text: Optional error message
     """
-    with get_conn() as conn:
-        conn.execute("""
-            UPDATE jobs 
-            SET status = ?, updated_at = ?, result_json = ?, error_text = ?
-            WHERE id = ?
-        """, (status, updated_at, result_json, error_text, job_id))
+    with _db() as conn:
+        conn.execute(_SQL_UPDATE, (status, updated_at, result_json, error_text, job_id))
         conn.commit()
     
     logger.info("Job updated", extra={
@@ -131,6 +229,55 @@ def update_job(
     })
 
 
+def create_jobs_bulk(rows: Iterable[Tuple[str, str, str, str]]) -> int:
+    """
+    Create many job records in a single transaction.
+    
+    Args:
+        rows: (job_id, pid, status, created_at) tuples, as for create_job
+        
+    Returns:
+        int: Number of rows inserted
+    """
+    with _db() as conn:
+        conn.execute("BEGIN IMMEDIATE")
+        cursor = conn.executemany(_SQL_INSERT, ((job_id, pid, status, created_at, created_at) for job_id, pid, status, created_at in rows))
+        count = cursor.rowcount
+    
+    logger.info("Jobs created", extra={
+        'count': count,
+        'db_operation': 'create_bulk'
+    })
+    return count
+
+
+def update_jobs_bulk(
+    rows: Iterable[Tuple[str, str, str, Optional[str], Optional[str]]]
+) -> int:
+    """
+    Update many job records in a single transaction.
+    
+    Args:
+        rows: (job_id, status, updated_at, result_json, error_text) tuples, as for update_job
+        
+    Returns:
+        int: Number of rows updated
+    """
+    with _db() as conn:
+        conn.execute("BEGIN IMMEDIATE")
+        cursor = conn.executemany(_SQL_UPDATE, (
+            (status, updated_at, result_json, error_text, job_id)
+            for job_id, status, updated_at, result_json, error_text in rows
+        ))
+        count = cursor.rowcount
+    
+    logger.info("Jobs updated", extra={
+        'count': count,
+        'db_operation': 'update_bulk'
+    })
+    return count
+
+
 def get_job(job_id: str) -> Optional[Dict[str, Any]]:
     """
     Retrieve a job record from the database.
@@ -141,11 +288,8 @@ def get_job(job_id: str) -> Optional[Dict[str, Any]]:
     Returns:
         dict: Job record as dictionary, or None if not found
     """
-    with get_conn() as conn:
-        cursor = conn.execute("""
-            SELECT id, pid, status, created_at, updated_at, result_json, error_text
-            FROM jobs WHERE id = ?
-        """, (job_id,))
+    with _db() as conn:
+        cursor = conn.execute(_SQL_GET, (job_id,))
         
         row = cursor.fetchone()
         if row is None:
@@ -157,7 +301,7 @@ def get_job(job_id: str) -> Optional[Dict[str, Any]]:
         # Parse JSON fields if present
         if job_dict['result_json']:
             try:
-                job_dict['result'] = json.loads(job_dict['result_json'])
+                job_dict['result'] = _loads(job_dict['result_json'])
             except json.JSONDecodeError:
                 logger.warning("Failed to parse result_json for job", extra={
                     'job_id': job_id,
@@ -173,47 +317,75 @@ def get_job(job_id: str) -> Optional[Dict[str, Any]]:
         return job_dict
 
 
-def list_jobs(project_id: Optional[str] = None) -> list[Dict[str, Any]]:
+def list_jobs(
+    project_id: Optional[str] = None,
+    include_result: bool = True,
+    limit: Optional[int] = None,
+    offset: int = 0,
+) -> list[Dict[str, Any]]:
     """
     List all jobs, optionally filtered by project_id.
     
     Args:
         project_id: Optional project ID filter
+        include_result: Select and decode result_json into 'result'; pass False
+            when only ids/status are needed to skip reading and parsing the blobs
+        limit: Optional maximum number of jobs to return
+        offset: Number of jobs to skip (with or without limit)
         
     Returns:
-        list: List of job dictionaries
+        list: List of job dictionaries, newest first
     """
-    with get_conn() as conn:
-        if project_id:
-            cursor = conn.execute("""
-                SELECT id, pid, status, created_at, updated_at, result_json, error_text
-                FROM jobs WHERE pid = ? ORDER BY created_at DESC
-            """, (project_id,))
-        else:
-            cursor = conn.execute("""
-                SELECT id, pid, status, created_at, updated_at, result_json, error_text
-                FROM jobs ORDER BY created_at DESC
-            """)
-        
-        jobs = []
-        for row in cursor.fetchall():
-            job_dict = dict(row)
-            
-            # Parse JSON fields if present
-            if job_dict['result_json']:
-                try:
-                    job_dict['result'] = json.loads(job_dict['result_json'])
-                except json.JSONDecodeError:
-                    job_dict['result'] = None
-            else:
-                job_dict['result'] = None
-            
-            # Remove the raw JSON field
-            del job_dict['result_json']
-            
-            jobs.append(job_dict)
+    return list(_iter_jobs(project_id, include_result, limit, offset))
+
+
+def _iter_jobs(
+    project_id: Optional[str],
+    include_result: bool,
+    limit: Optional[int],
+    offset: int,
+    batch_size: int = 512,
+) -> Iterator[Dict[str, Any]]:
+    """
+    Yield job dictionaries for list_jobs, fetching rows in batches of batch_size
+    so a large listing never holds two full copies (rows + dicts) in memory.
+    
+    The shared connection stays locked until the generator is exhausted or
+    closed, so consume it promptly.
+    """
+    columns = "id, pid, status, created_at, updated_at, error_text"
+    if include_result:
+        columns += ", result_json"
+    sql = f"SELECT {columns} FROM jobs"
+    params: list[Any] = []
+    if project_id:
+        sql += " WHERE pid = ?"
+        params.append(project_id)
+    sql += " ORDER BY created_at DESC"
+    if limit is not None or offset:
+        # SQLite only accepts OFFSET after LIMIT; -1 means no limit
+        sql += " LIMIT ? OFFSET ?"
+        params.extend((-1 if limit is None else limit, offset))
+    
+    with _db() as conn:
+        cursor = conn.execute(sql, params)
         
-        return jobs
+        while rows := cursor.fetchmany(batch_size):
+            for row in rows:
+                job_dict = dict(row)
+                
+                if include_result:
+                    # Parse JSON fields if present
+                    raw = job_dict.pop('result_json')
+                    if raw:
+                        try:
+                            job_dict['result'] = _loads(raw)
+                        except json.JSONDecodeError:
+                            job_dict['result'] = None
+                    else:
+                        job_dict['result'] = None
+                
+                yield job_dict
 
 
 def delete_job(job_id: str) -> bool:
@@ -226,8 +398,8 @@ def delete_job(job_id: str) -> bool:
     Returns:
         bool: True if job was deleted, False if not found
     """
-    with get_conn() as conn:
-        cursor = conn.execute("DELETE FROM jobs WHERE id = ?", (job_id,))
+    with _db() as conn:
+        cursor = conn.execute(_SQL_DELETE, (job_id,))
         conn.commit()
         
         deleted = cursor.rowcount > 0
@@ -251,10 +423,10 @@ def get_job_count(project_id: Optional[str] = None) -> int:
     Returns:
         int: Number of jobs
     """
-    with get_conn() as conn:
+    with _db() as conn:
         if project_id:
-            cursor = conn.execute("SELECT COUNT(*) FROM jobs WHERE pid = ?", (project_id,))
+            cursor = conn.execute(_SQL_COUNT_BY_PID, (project_id,))
         else:
-            cursor = conn.execute("SELECT COUNT(*) FROM jobs")
+            cursor = conn.execute(_SQL_COUNT_ALL)
         
         return cursor.fetchone()[0]
@@ -1,11 +1,42 @@
 """Detection service that orchestrates raster rendering, detection, and coordinate mapping."""
+import asyncio
+import os
 import numpy as np
+from collections import Counter
 from typing import List, Dict, Tuple, Any
 from pathlib import Path
 
-from .raster import render_pdf_page, px_to_pdf
+from .raster import render_pdf_page, px_to_pdf_batch
 from .detectors import get_detector
+from .detectors.base import DetectionArray
 from backend.app.core.config import settings
+from backend.app.core.logging import json_logger
+
+logger = json_logger(__name__)
+
+# Pages rendered/detected at once by run_detection_batch; each 300 DPI page is ~25 MB of RGB.
+_BATCH_CONCURRENCY = min(4, os.cpu_count() or 1)
+
+
+def _to_pdf_detections(hits, meta: Dict) -> Tuple[List[Dict], Counter]:
+    """
+    Convert detector hits (Detection objects, dicts or a DetectionArray) to
+    PDF-space detection dicts with one vectorised coordinate transform, and
+    tally the per-type summary in the same pass.
+    """
+    arr = DetectionArray.from_hits(hits)
+    x_pdf, y_pdf = px_to_pdf_batch(arr.xs, arr.ys, meta)
+    
+    detections = [
+        {
+            "type": t,
+            "x_pdf": x,
+            "y_pdf": y,
+            "confidence": c
+        }
+        for t, x, y, c in zip(arr.types, x_pdf.tolist(), y_pdf.tolist(), arr.confs.tolist())
+    ]
+    return detections, Counter(arr.types)
 
 
 async def run_detection(pdf_path: str, page: int) -> Tuple[List[Dict], Dict]:
@@ -30,29 +61,18 @@ async def run_detection(pdf_path: str, page: int) -> Tuple[List[Dict], Dict]:
         raise ValueError(f"Page number must be non-negative, got: {page}")
     
     # Step 1: Rasterize the PDF page to RGB numpy array
-    print(f"Rendering PDF page {page} from {pdf_path}")
-    img_array, meta = render_pdf_page(str(pdf_path), page, dpi=300)
+    logger.debug("Rendering PDF page %d from %s", page, pdf_path)
+    # Rasterising is blocking C code (releases the GIL); keep it off the event loop
+    img_array, meta = await asyncio.to_thread(render_pdf_page, str(pdf_path), page, dpi=300)
     
     # Step 2: Get detector and run detection
-    print(f"Running detection with {settings.DETECTOR_IMPL} detector")
+    logger.debug("Running detection with %s detector", settings.DETECTOR_IMPL)
     detector = get_detector(settings.DETECTOR_IMPL)
     hits = await detector.detect(img_array)
     
     # Step 3: Convert pixel coordinates to PDF coordinates
-    print(f"Converting {len(hits)} detections to PDF coordinates")
-    detections = []
-    
-    for hit in hits:
-        # Convert pixel coordinates to PDF coordinates
-        x_pdf, y_pdf = px_to_pdf(hit["x_px"], hit["y_px"], meta)
-        
-        detection_dict = {
-            "type": hit["type"],
-            "x_pdf": x_pdf,
-            "y_pdf": y_pdf,
-            "confidence": hit["confidence"]
-        }
-        detections.append(detection_dict)
+    logger.debug("Converting %d detections to PDF coordinates", len(hits))
+    detections, type_counts = _to_pdf_detections(hits, meta)
     
     # Step 4: Prepare metadata
     detection_meta = {
@@ -65,16 +85,10 @@ async def run_detection(pdf_path: str, page: int) -> Tuple[List[Dict], Dict]:
     }
     
     # Add detection summary by type
-    type_counts = {}
-    for detection in detections:
-        type_name = detection["type"]
-        type_counts[type_name] = type_counts.get(type_name, 0) + 1
+    detection_meta["type_counts"] = dict(type_counts)
     
-    detection_meta["type_counts"] = type_counts
-    
-    print(f"Detection complete: {len(detections)} objects found")
-    for type_name, count in type_counts.items():
-        print(f"  - {type_name}: {count}")
+    logger.debug("Detection complete: %d objects found", len(detections),
+                 extra={'result': detection_meta["type_counts"]})
     
     return detections, detection_meta
 
@@ -106,29 +120,17 @@ async def run_detection_with_region(
         raise ValueError(f"Page number must be non-negative, got: {page}")
     
     # Step 1: Render the specific region
-    print(f"Rendering PDF page {page} region {region} from {pdf_path}")
-    img_array, meta = render_pdf_page_region(str(pdf_path), page, region, dpi=300)
+    logger.debug("Rendering PDF page %d region %s from %s", page, region, pdf_path)
+    img_array, meta = await asyncio.to_thread(render_pdf_page_region, str(pdf_path), page, region, dpi=300)
     
     # Step 2: Get detector and run detection
-    print(f"Running detection with {settings.DETECTOR_IMPL} detector")
+    logger.debug("Running detection with %s detector", settings.DETECTOR_IMPL)
     detector = get_detector(settings.DETECTOR_IMPL)
     hits = await detector.detect(img_array)
     
     # Step 3: Convert pixel coordinates to PDF coordinates
-    print(f"Converting {len(hits)} detections to PDF coordinates")
-    detections = []
-    
-    for hit in hits:
-        # Convert pixel coordinates to PDF coordinates
-        x_pdf, y_pdf = px_to_pdf(hit["x_px"], hit["y_px"], meta)
-        
-        detection_dict = {
-            "type": hit["type"],
-            "x_pdf": x_pdf,
-            "y_pdf": y_pdf,
-            "confidence": hit["confidence"]
-        }
-        detections.append(detection_dict)
+    logger.debug("Converting %d detections to PDF coordinates", len(hits))
+    detections, type_counts = _to_pdf_detections(hits, meta)
     
     # Step 4: Prepare metadata
     detection_meta = {
@@ -142,16 +144,10 @@ async def run_detection_with_region(
     }
     
     # Add detection summary by type
-    type_counts = {}
-    for detection in detections:
-        type_name = detection["type"]
-        type_counts[type_name] = type_counts.get(type_name, 0) + 1
-    
-    detection_meta["type_counts"] = type_counts
+    detection_meta["type_counts"] = dict(type_counts)
     
-    print(f"Region detection complete: {len(detections)} objects found")
-    for type_name, count in type_counts.items():
-        print(f"  - {type_name}: {count}")
+    logger.debug("Region detection complete: %d objects found", len(detections),
+                 extra={'result': detection_meta["type_counts"]})
     
     return detections, detection_meta
 
@@ -167,15 +163,24 @@ async def run_detection_batch(pdf_path: str, pages: List[int]) -> Dict[int, Tupl
     Returns:
         Dictionary mapping page numbers to (detections, metadata) tuples
     """
-    results = {}
+    # Pages are independent; run them concurrently, bounded to cap memory and CPU use
+    sem = asyncio.Semaphore(_BATCH_CONCURRENCY)
+    
+    async def _one(page: int) -> Tuple[List[Dict], Dict]:
+        async with sem:
+            return await run_detection(pdf_path, page)
     
-    for page in pages:
-        try:
-            detections, meta = await run_detection(pdf_path, page)
-            results[page] = (detections, meta)
-        except Exception as e:
-            print(f"Error processing page {page}: {e}")
-            results[page] = ([], {"error": str(e)})
+    outcomes = await asyncio.gather(*(_one(page) for page in pages), return_exceptions=True)
+    
+    results = {}
+    for page, outcome in zip(pages, outcomes):
+        if isinstance(outcome, Exception):
+            logger.warning("Error processing page %d", page, extra={'error': str(outcome)})
+            results[page] = ([], {"error": str(outcome)})
+        elif isinstance(outcome, BaseException):
+            raise outcome
+        else:
+            results[page] = outcome
     
     return results
 
@@ -191,7 +196,7 @@ def get_detection_summary(results: Dict[int, Tuple[List[Dict], Dict]]) -> Dict[s
         Summary dictionary with totals and statistics
     """
     total_detections = 0
-    type_totals = {}
+    type_totals = Counter()
     successful_pages = 0
     failed_pages = 0
     
@@ -203,15 +208,13 @@ def get_detection_summary(results: Dict[int, Tuple[List[Dict], Dict]]) -> Dict[s
         successful_pages += 1
         total_detections += len(detections)
         
-        for detection in detections:
-            type_name = detection["type"]
-            type_totals[type_name] = type_totals.get(type_name, 0) + 1
+        type_totals.update(detection["type"] for detection in detections)
     
     return {
         "total_pages": len(results),
         "successful_pages": successful_pages,
         "failed_pages": failed_pages,
         "total_detections": total_detections,
-        "type_totals": type_totals,
+        "type_totals": dict(type_totals),
         "average_detections_per_page": total_detections / successful_pages if successful_pages > 0 else 0
     }
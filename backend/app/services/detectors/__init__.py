@@ -1,3 +1,6 @@
+import os
+from functools import lru_cache
+
 from backend.app.core.config import settings
 
 def init_depth_config(base_dir: str = "config") -> None:
@@ -5,21 +8,32 @@ def init_depth_config(base_dir: str = "config") -> None:
     from .depth import init_depth_config as _init_depth_config
     _init_depth_config(base_dir)
 
+def _templates_stamp(templates_dir) -> int:
+    """Newest mtime (ns) of the templates dir and its entries; 0 if it does not exist."""
+    try:
+        stamp = os.stat(templates_dir).st_mtime_ns
+        with os.scandir(templates_dir) as it:
+            for entry in it:
+                stamp = max(stamp, entry.stat().st_mtime_ns)
+        return stamp
+    except (FileNotFoundError, NotADirectoryError, TypeError):
+        return 0
+
+@lru_cache(maxsize=4)
+def _vision_detector(model: str, tile_px: int, overlap_px: int):
+    from .vision_llm import VisionLLMDetector  # lazy import
+    return VisionLLMDetector(model=model, tile_px=tile_px, overlap_px=overlap_px)
+
+@lru_cache(maxsize=4)
+def _template_detector(templates_dir, stamp: int):
+    # stamp only keys the cache: editing/adding a template yields a fresh detector
+    from .opencv_template import OpenCVTemplateDetector  # lazy import
+    return OpenCVTemplateDetector(templates_dir)
+
 def get_detector(name: str):
-    if name == "vision_llm":
-        from .vision_llm import VisionLLMDetector  # lazy import
-        return VisionLLMDetector(
-            model=settings.VISION_MODEL,
-            tile_px=settings.TILE_PX,
-            overlap_px=settings.TILE_OVERLAP_PX,
-        )
+    """Return a detector for name; instances are reused while their settings/templates are unchanged."""
     if name == "opencv_template":
-        from .opencv_template import OpenCVTemplateDetector  # lazy import
-        return OpenCVTemplateDetector(getattr(settings, "TEMPLATES_DIR", None))
-    # default to vision to avoid importing cv2 unintentionally
-    from .vision_llm import VisionLLMDetector
-    return VisionLLMDetector(
-        model=settings.VISION_MODEL,
-        tile_px=settings.TILE_PX,
-        overlap_px=settings.TILE_OVERLAP_PX,
-    )
\ No newline at end of file
+        templates_dir = getattr(settings, "TEMPLATES_DIR", None)
+        return _template_detector(templates_dir, _templates_stamp(templates_dir))
+    # vision_llm, and the default to avoid importing cv2 unintentionally
+    return _vision_detector(settings.VISION_MODEL, settings.TILE_PX, settings.TILE_OVERLAP_PX)
@@ -1,10 +1,10 @@
 """Base detector interface and types."""
 from dataclasses import dataclass
-from typing import Protocol, List
+from typing import Any, Dict, Iterable, List, Protocol, Union
 import numpy as np
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Detection:
     """Represents a single detection result."""
     type: str
@@ -13,10 +13,50 @@ class Detection:
     confidence: float
 
 
+@dataclass(slots=True)
+class DetectionArray:
+    """
+    Column-wise (SoA) view of many detections: float64 arrays for the numeric
+    fields plus a parallel list of type names, for vectorised post-processing.
+    """
+    xs: np.ndarray
+    ys: np.ndarray
+    confs: np.ndarray
+    types: List[str]
+
+    def __len__(self) -> int:
+        return len(self.types)
+
+    @classmethod
+    def from_hits(cls, hits: Union["DetectionArray", Iterable[Union[Detection, Dict[str, Any]]]]) -> "DetectionArray":
+        """Build from Detection objects or {type, x_px, y_px, confidence} dicts."""
+        if isinstance(hits, DetectionArray):
+            return hits
+        rows = [
+            (h.type, h.x_px, h.y_px, h.confidence) if isinstance(h, Detection)
+            else (h["type"], h["x_px"], h["y_px"], h["confidence"])
+            for h in hits
+        ]
+        n = len(rows)
+        return cls(
+            xs=np.fromiter((r[1] for r in rows), dtype=np.float64, count=n),
+            ys=np.fromiter((r[2] for r in rows), dtype=np.float64, count=n),
+            confs=np.fromiter((r[3] for r in rows), dtype=np.float64, count=n),
+            types=[r[0] for r in rows],
+        )
+
+    def to_dicts(self) -> List[Dict[str, Any]]:
+        """Row-wise dicts in the {type, x_px, y_px, confidence} shape detectors emit."""
+        return [
+            {"type": t, "x_px": x, "y_px": y, "confidence": c}
+            for t, x, y, c in zip(self.types, self.xs.tolist(), self.ys.tolist(), self.confs.tolist())
+        ]
+
+
 class Detector(Protocol):
     """Plugin contract for detection implementations."""
     
-    def detect(self, img: np.ndarray) -> List[Detection]:
+    def detect(self, img: np.ndarray) -> Union[List[Detection], DetectionArray]:
         """
         Detect objects in an image.
         
@@ -24,6 +64,6 @@ class Detector(Protocol):
             img: Input image as numpy array (RGB format)
             
         Returns:
-            List of Detection objects
+            List of Detection objects, or a DetectionArray for large hit counts
         """
         ...
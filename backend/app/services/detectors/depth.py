@@ -8,48 +8,74 @@ Provides functions to:
 - Validate minimum cover requirements
 """
 import json
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Tuple, Optional, NamedTuple
+from typing import Dict, List, Tuple, Optional, NamedTuple, Union
 from dataclasses import dataclass
 import math
 
+import numpy as np
+
 
 # Global config storage
 _od_lookup: Dict[str, Dict[str, float]] = {}
 _trench_defaults: Dict[str, any] = {}
+# od_ft results keyed by (material, dia_in); cleared whenever the lookup table is reloaded
+_od_ft_cache: Dict[Tuple[str, float], float] = {}
+
+
+# Fallback defaults when the config files are missing (treated as read-only)
+_DEFAULT_OD_LOOKUP: Dict[str, Dict[str, float]] = {
+    "pvc": {"4": 4.5, "6": 6.625, "8": 8.625, "10": 10.75, "12": 12.75},
+    "rcp": {"12": 12.0, "15": 15.0, "18": 18.0, "21": 21.0, "24": 24.0}
+}
+_DEFAULT_TRENCH_DEFAULTS: Dict[str, any] = {
+    "bedding_clearance_ft": 0.5,
+    "side_slope_m_per_ft": 0.5,
+    "use_shoring_box": True,
+    "min_cover_ft": {"water": 3.0, "sewer": 2.5, "storm": 1.5}
+}
+
+
+@lru_cache(maxsize=8)
+def _load_json_file(path: str, mtime_ns: int) -> Dict:
+    # mtime_ns only keys the cache: an edited config file is parsed again
+    with open(path, 'r') as f:
+        return json.load(f)
+
+
+def _read_config_file(path: Path) -> Optional[Dict]:
+    """Parsed JSON at path (cached until the file changes), or None if it does not exist."""
+    try:
+        mtime_ns = path.stat().st_mtime_ns
+    except FileNotFoundError:
+        return None
+    return _load_json_file(str(path), mtime_ns)
 
 
 def init_depth_config(base_dir: str = "config") -> None:
-    """Initialize depth calculation configuration from JSON files."""
+    """
+    Initialize depth calculation configuration from JSON files.
+    
+    Cheap to call repeatedly (each detector run does): unchanged files are
+    served from the parse cache and the od_ft cache is kept unless the OD
+    table actually changed.
+    """
     global _od_lookup, _trench_defaults
     
     base_path = Path(base_dir)
     
     # Load OD lookup table
-    od_file = base_path / "pipes" / "od_lookup.json"
-    if od_file.exists():
-        with open(od_file, 'r') as f:
-            _od_lookup = json.load(f)
-    else:
-        # Fallback defaults
-        _od_lookup = {
-            "pvc": {"4": 4.5, "6": 6.625, "8": 8.625, "10": 10.75, "12": 12.75},
-            "rcp": {"12": 12.0, "15": 15.0, "18": 18.0, "21": 21.0, "24": 24.0}
-        }
+    od_lookup = _read_config_file(base_path / "pipes" / "od_lookup.json")
+    if od_lookup is None:
+        od_lookup = _DEFAULT_OD_LOOKUP
+    if od_lookup is not _od_lookup:
+        _od_ft_cache.clear()
+    _od_lookup = od_lookup
     
     # Load trench defaults
-    trench_file = base_path / "pipes" / "trench_defaults.json"
-    if trench_file.exists():
-        with open(trench_file, 'r') as f:
-            _trench_defaults = json.load(f)
-    else:
-        # Fallback defaults
-        _trench_defaults = {
-            "bedding_clearance_ft": 0.5,
-            "side_slope_m_per_ft": 0.5,
-            "use_shoring_box": True,
-            "min_cover_ft": {"water": 3.0, "sewer": 2.5, "storm": 1.5}
-        }
+    trench_defaults = _read_config_file(base_path / "pipes" / "trench_defaults.json")
+    _trench_defaults = trench_defaults if trench_defaults is not None else _DEFAULT_TRENCH_DEFAULTS
 
 
 def od_ft(material: str, dia_in: float) -> float:
@@ -63,6 +89,11 @@ def od_ft(material: str, dia_in: float) -> float:
     Returns:
         Outside diameter in feet
     """
+    key = (material, dia_in)
+    cached = _od_ft_cache.get(key)
+    if cached is not None:
+        return cached
+    
     if not _od_lookup:
         init_depth_config()
     
@@ -71,13 +102,16 @@ def od_ft(material: str, dia_in: float) -> float:
     
     if material_lower in _od_lookup and dia_str in _od_lookup[material_lower]:
         od_inches = _od_lookup[material_lower][dia_str]
-        return od_inches / 12.0  # Convert to feet
+        result = od_inches / 12.0  # Convert to feet
+    else:
+        # Fallback: assume OD is 1.2x nominal diameter
+        result = (dia_in * 1.2) / 12.0
     
-    # Fallback: assume OD is 1.2x nominal diameter
-    return (dia_in * 1.2) / 12.0
+    _od_ft_cache[key] = result
+    return result
 
 
-@dataclass
+@dataclass(slots=True)
 class DepthSample:
     """Single depth sample along a pipe run."""
     station: float  # Station along pipe (0.0 to 1.0)
@@ -89,6 +123,41 @@ class DepthSample:
     trench_area_sf: float  # Trench cross-sectional area
 
 
+@dataclass(slots=True)
+class DepthSamples:
+    """Depth samples along a pipe run as parallel arrays (one entry per station)."""
+    station: np.ndarray
+    invert_ft: np.ndarray
+    ground_ft: np.ndarray
+    depth_ft: np.ndarray
+    cover_ft: np.ndarray
+    trench_width_ft: np.ndarray
+    trench_area_sf: np.ndarray
+    
+    def __len__(self) -> int:
+        return len(self.station)
+    
+    @classmethod
+    def from_samples(cls, samples: List[DepthSample]) -> "DepthSamples":
+        """Pack DepthSample objects into column arrays."""
+        rows = np.array(
+            [(s.station, s.invert_ft, s.ground_ft, s.depth_ft, s.cover_ft,
+              s.trench_width_ft, s.trench_area_sf) for s in samples],
+            dtype=np.float64,
+        ).reshape(-1, 7)
+        return cls(*rows.T)
+    
+    def to_list(self) -> List[DepthSample]:
+        """Unpack into DepthSample objects holding plain Python floats."""
+        return [
+            DepthSample(*row) for row in zip(
+                self.station.tolist(), self.invert_ft.tolist(), self.ground_ft.tolist(),
+                self.depth_ft.tolist(), self.cover_ft.tolist(),
+                self.trench_width_ft.tolist(), self.trench_area_sf.tolist(),
+            )
+        ]
+
+
 def sample_depth_along_run(
     s_profile: List[Tuple[float, float]],  # [(station, invert_elevation)]
     ground_at_s: callable,  # Function: station -> ground_elevation
@@ -109,8 +178,23 @@ def sample_depth_along_run(
     Returns:
         List of DepthSample objects
     """
-    if not s_profile:
-        return []
+    return sample_depth_arrays(s_profile, ground_at_s, material, dia_in, n_samples).to_list()
+
+
+def sample_depth_arrays(
+    s_profile: List[Tuple[float, float]],
+    ground_at_s: callable,
+    material: str,
+    dia_in: float,
+    n_samples: int = 20
+) -> DepthSamples:
+    """
+    Array form of sample_depth_along_run: every quantity is computed for all
+    stations at once and returned as a DepthSamples of ndarrays.
+    """
+    if not s_profile or n_samples <= 0:
+        empty = np.empty(0, dtype=np.float64)
+        return DepthSamples(empty, empty, empty, empty, empty, empty, empty)
     
     # Get pipe outside diameter
     pipe_od_ft = od_ft(material, dia_in)
@@ -119,41 +203,44 @@ def sample_depth_along_run(
     bedding_clearance = _trench_defaults.get("bedding_clearance_ft", 0.5)
     side_slope = _trench_defaults.get("side_slope_m_per_ft", 0.5)
     
-    samples = []
+    # Loop-invariant per pipe: trench width and crown offset depend only on OD and bedding
+    trench_width_ft = pipe_od_ft + (2 * bedding_clearance)
+    crown_offset_ft = pipe_od_ft / 2
     
-    for i in range(n_samples):
-        station = i / (n_samples - 1) if n_samples > 1 else 0.0
-        
-        # Interpolate invert elevation
-        invert_ft = _interpolate_elevation(s_profile, station)
-        
-        # Get ground elevation
-        ground_ft = ground_at_s(station)
-        
-        # Calculate depth and cover
-        depth_ft = ground_ft - invert_ft
-        cover_ft = depth_ft - (pipe_od_ft / 2)  # Cover to pipe crown
-        
-        # Calculate trench dimensions
-        trench_width_ft = pipe_od_ft + (2 * bedding_clearance)
-        trench_area_sf = _calculate_trench_area(
-            pipe_od_ft, depth_ft, bedding_clearance, side_slope
-        )
-        
-        samples.append(DepthSample(
-            station=station,
-            invert_ft=invert_ft,
-            ground_ft=ground_ft,
-            depth_ft=depth_ft,
-            cover_ft=cover_ft,
-            trench_width_ft=trench_width_ft,
-            trench_area_sf=trench_area_sf
-        ))
-    
-    return samples
+    # Stations 0..1, computed as i / (n - 1) like the original per-sample loop
+    if n_samples > 1:
+        stations = np.arange(n_samples, dtype=np.float64) / (n_samples - 1)
+    else:
+        stations = np.zeros(n_samples, dtype=np.float64)
+    
+    # Interpolate invert elevation
+    invert_ft = _interpolate_elevations(s_profile, stations)
+    
+    # Get ground elevation (ground_at_s is a scalar callable)
+    ground_ft = np.fromiter(
+        (ground_at_s(s) for s in stations.tolist()), dtype=np.float64, count=n_samples
+    )
+    
+    # Calculate depth and cover
+    depth_ft = ground_ft - invert_ft
+    cover_ft = depth_ft - crown_offset_ft  # Cover to pipe crown
+    
+    # Trapezoidal trench section: bottom width is trench_width_ft, sides slope out with depth
+    top_width_ft = trench_width_ft + (2 * depth_ft * side_slope)
+    trench_area_sf = (trench_width_ft + top_width_ft) / 2 * depth_ft
+    
+    return DepthSamples(
+        station=stations,
+        invert_ft=invert_ft,
+        ground_ft=ground_ft,
+        depth_ft=depth_ft,
+        cover_ft=cover_ft,
+        trench_width_ft=np.full(n_samples, trench_width_ft, dtype=np.float64),
+        trench_area_sf=trench_area_sf,
+    )
 
 
-@dataclass
+@dataclass(slots=True)
 class DepthSummary:
     """Summary statistics for pipe depth analysis."""
     min_depth_ft: float
@@ -166,58 +253,56 @@ class DepthSummary:
     deep_excavation: bool
 
 
-def summarize_depth(samples: List[DepthSample], discipline: str) -> DepthSummary:
+# Depth bucket labels and their upper edges (ft); the last bucket is open-ended
+_DEPTH_BUCKETS = ("0-5", "5-8", "8-12", "12+")
+_DEPTH_BUCKET_EDGES_FT = np.array([5.0, 8.0, 12.0])
+
+
+def summarize_depth(samples: Union[List[DepthSample], DepthSamples], discipline: str) -> DepthSummary:
     """
     Summarize depth statistics from samples.
     
     Args:
-        samples: List of DepthSample objects
+        samples: List of DepthSample objects, or a DepthSamples from sample_depth_arrays
         discipline: Pipe discipline (water, sewer, storm)
         
     Returns:
         DepthSummary with statistics and flags
     """
-    if not samples:
+    if not isinstance(samples, DepthSamples):
+        samples = DepthSamples.from_samples(samples)
+    n = len(samples)
+    if not n:
         return DepthSummary(
             min_depth_ft=0.0, max_depth_ft=0.0, avg_depth_ft=0.0, p95_depth_ft=0.0,
             buckets_lf={}, trench_volume_cy=0.0, cover_ok=True, deep_excavation=False
         )
     
     # Calculate basic statistics
-    depths = [s.depth_ft for s in samples]
-    min_depth_ft = min(depths)
-    max_depth_ft = max(depths)
-    avg_depth_ft = sum(depths) / len(depths)
+    depths = samples.depth_ft
+    min_depth_ft = float(depths.min())
+    max_depth_ft = float(depths.max())
+    avg_depth_ft = float(depths.mean())
     
-    # Calculate P95 depth
-    sorted_depths = sorted(depths)
-    p95_index = int(len(sorted_depths) * 0.95)
-    p95_depth_ft = sorted_depths[p95_index] if p95_index < len(sorted_depths) else max_depth_ft
+    # Calculate P95 depth (selection, not a full sort: only the k-th value is needed)
+    p95_index = int(n * 0.95)
+    p95_depth_ft = float(np.partition(depths, p95_index)[p95_index]) if p95_index < n else max_depth_ft
     
     # Calculate depth buckets (assuming equal spacing)
     total_length = 1.0  # Normalized length
-    segment_length = total_length / len(samples)
-    
-    buckets_lf = {"0-5": 0.0, "5-8": 0.0, "8-12": 0.0, "12+": 0.0}
-    
-    for sample in samples:
-        depth = sample.depth_ft
-        if depth < 5.0:
-            buckets_lf["0-5"] += segment_length
-        elif depth < 8.0:
-            buckets_lf["5-8"] += segment_length
-        elif depth < 12.0:
-            buckets_lf["8-12"] += segment_length
-        else:
-            buckets_lf["12+"] += segment_length
+    segment_length = total_length / n
+    
+    # Bucket index per sample: 0 for depth < 5, 1 for < 8, 2 for < 12, 3 otherwise
+    counts = np.bincount(np.digitize(depths, _DEPTH_BUCKET_EDGES_FT), minlength=len(_DEPTH_BUCKETS))
+    buckets_lf = dict(zip(_DEPTH_BUCKETS, (counts * segment_length).tolist()))
     
     # Calculate total trench volume
-    total_area_sf = sum(s.trench_area_sf for s in samples)
+    total_area_sf = float(samples.trench_area_sf.sum())
     trench_volume_cy = total_area_sf / 27.0  # Convert SF to CY
     
     # Check cover requirements
     min_cover_ft = _trench_defaults.get("min_cover_ft", {}).get(discipline, 1.5)
-    cover_ok = all(s.cover_ft >= min_cover_ft for s in samples)
+    cover_ok = bool((samples.cover_ft >= min_cover_ft).all())
     
     # Check for deep excavation (OSHA requirements)
     deep_excavation = max_depth_ft > 5.0
@@ -234,50 +319,39 @@ def summarize_depth(samples: List[DepthSample], discipline: str) -> DepthSummary
     )
 
 
-def _interpolate_elevation(s_profile: List[Tuple[float, float]], station: float) -> float:
-    """Interpolate elevation at given station along profile."""
+def _interpolate_elevations(s_profile: List[Tuple[float, float]], stations: np.ndarray) -> np.ndarray:
+    """
+    Interpolate elevations at many stations along a profile sorted by station.
+    
+    Inside the profile this is np.interp (binary search, no Python loop).
+    Stations outside it are extrapolated linearly from the last segment,
+    as the original per-station scan did, rather than clamped.
+    """
     if not s_profile:
-        return 0.0
+        return np.zeros_like(stations)
     
-    if len(s_profile) == 1:
-        return s_profile[0][1]
+    profile = np.asarray(s_profile, dtype=np.float64)
+    if len(profile) == 1:
+        return np.full_like(stations, profile[0, 1])
     
-    # Find surrounding stations
-    for i in range(len(s_profile) - 1):
-        s1, elev1 = s_profile[i]
-        s2, elev2 = s_profile[i + 1]
-        
-        if s1 <= station <= s2:
-            # Linear interpolation
-            if s2 == s1:
-                return elev1
-            ratio = (station - s1) / (s2 - s1)
-            return elev1 + ratio * (elev2 - elev1)
-    
-    # Extrapolate from last segment
-    s1, elev1 = s_profile[-2]
-    s2, elev2 = s_profile[-1]
-    if s2 != s1:
-        ratio = (station - s1) / (s2 - s1)
-        return elev1 + ratio * (elev2 - elev1)
-    
-    return s_profile[-1][1]
-
-
-def _calculate_trench_area(
-    od_ft: float,
-    depth_ft: float,
-    bedding_clearance: float,
-    side_slope: float
-) -> float:
-    """Calculate trench cross-sectional area in square feet."""
-    # Trench bottom width
-    bottom_width = od_ft + (2 * bedding_clearance)
-    
-    # Trench top width (accounting for side slopes)
-    top_width = bottom_width + (2 * depth_ft * side_slope)
-    
-    # Trapezoidal area
-    area = (bottom_width + top_width) / 2 * depth_ft
-    
-    return area
+    xp = profile[:, 0]
+    fp = profile[:, 1]
+    elevations = np.interp(stations, xp, fp)
+    
+    # np.interp takes the last of repeated stations (a vertical drop); the scan used the first
+    if (xp[1:] == xp[:-1]).any():
+        first = np.searchsorted(xp, stations, side="left").clip(max=len(xp) - 1)
+        on_knot = xp[first] == stations
+        elevations[on_knot] = fp[first[on_knot]]
+    
+    outside = (stations < xp[0]) | (stations > xp[-1])
+    if outside.any():
+        s1, elev1 = profile[-2]
+        s2, elev2 = profile[-1]
+        if s2 != s1:
+            ratio = (stations[outside] - s1) / (s2 - s1)
+            elevations[outside] = elev1 + ratio * (elev2 - elev1)
+        else:
+            elevations[outside] = elev2
+    
+    return elevations
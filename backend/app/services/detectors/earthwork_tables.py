@@ -5,10 +5,20 @@ This module provides functions to parse earthwork summary tables
 from PDF text content.
 """
 from dataclasses import dataclass
-from typing import List, Dict, Any, Optional
+from functools import lru_cache
+from typing import List, Dict, Any, Optional, Tuple
 import re
 
 
+# Quantity patterns, compiled once instead of on every text element
+_CUT_RE = re.compile(r'cut[:\s]*(\d+(?:\.\d+)?)\s*cy', re.IGNORECASE)
+_FILL_RE = re.compile(r'fill[:\s]*(\d+(?:\.\d+)?)\s*cy', re.IGNORECASE)
+_UNDERCUT_RE = re.compile(r'undercut[:\s]*(\d+(?:\.\d+)?)\s*cy', re.IGNORECASE)
+# Every quantity pattern ends in "<digit> cy"; one scan for it rejects the vast
+# majority of sheet text before the three searches run
+_QUANTITY_CY_RE = re.compile(r'\d\s*cy', re.IGNORECASE)
+
+
 @dataclass
 class CutFillSummary:
     """Earthwork summary from tables."""
@@ -17,6 +27,28 @@ class CutFillSummary:
     undercut_cy: Optional[float] = None
 
 
+def _match_cy(pattern: "re.Pattern[str]", text: str) -> Optional[float]:
+    match = pattern.search(text)
+    if match:
+        try:
+            return float(match.group(1))
+        except ValueError:
+            pass
+    return None
+
+
+@lru_cache(maxsize=4096)
+def _parse_quantities(text: str) -> Tuple[Optional[float], Optional[float], Optional[float]]:
+    """
+    (cut, fill, undercut) CY found in one stripped text string, None where absent.
+    
+    Cached per string: sheets repeat the same labels many times.
+    """
+    if not _QUANTITY_CY_RE.search(text):
+        return None, None, None
+    return _match_cy(_CUT_RE, text), _match_cy(_FILL_RE, text), _match_cy(_UNDERCUT_RE, text)
+
+
 def parse_earthwork_summary(texts: List[Dict[str, Any]]) -> CutFillSummary:
     """
     Parse earthwork summary from text elements.
@@ -33,27 +65,14 @@ def parse_earthwork_summary(texts: List[Dict[str, Any]]) -> CutFillSummary:
         if not text:
             continue
         
-        # Look for cut/fill patterns
-        cut_match = re.search(r'cut[:\s]*(\d+(?:\.\d+)?)\s*cy', text, re.IGNORECASE)
-        if cut_match:
-            try:
-                cut_cy = float(cut_match.group(1))
-            except ValueError:
-                pass
-        
-        fill_match = re.search(r'fill[:\s]*(\d+(?:\.\d+)?)\s*cy', text, re.IGNORECASE)
-        if fill_match:
-            try:
-                fill_cy = float(fill_match.group(1))
-            except ValueError:
-                pass
-        
-        undercut_match = re.search(r'undercut[:\s]*(\d+(?:\.\d+)?)\s*cy', text, re.IGNORECASE)
-        if undercut_match:
-            try:
-                undercut_cy = float(undercut_match.group(1))
-            except ValueError:
-                pass
+        # Look for cut/fill patterns; a later match overrides an earlier one
+        cut, fill, undercut = _parse_quantities(text)
+        if cut is not None:
+            cut_cy = cut
+        if fill is not None:
+            fill_cy = fill
+        if undercut is not None:
+            undercut_cy = undercut
     
     return CutFillSummary(
         cut_cy=cut_cy,
@@ -8,6 +8,7 @@ except Exception as e:
     ) from e
 
 import numpy as np
+from itertools import chain
 from pathlib import Path
 from typing import List, Tuple
 from .base import Detection, Detector
@@ -125,7 +126,7 @@ class OpenCVTemplateDetector:
         if not self.templates:
             return []
         
-        all_detections = []
+        per_template = []
         
         for template_name, template_data in self.templates.items():
             template = template_data['template']
@@ -156,21 +157,18 @@ class OpenCVTemplateDetector:
                 template_detections.append((template_name, center_x, center_y, confidence))
             
             # Apply NMS to this template's detections
-            filtered_detections = self._apply_nms(template_detections, template_width, template_height)
-            all_detections.extend(filtered_detections)
+            per_template.append(self._apply_nms(template_detections, template_width, template_height))
         
-        # Convert to Detection objects
-        detections = []
-        for type_name, x, y, confidence in all_detections:
-            detection = Detection(
+        # Flatten the per-template results once and convert to Detection objects
+        return [
+            Detection(
                 type=type_name,
                 x_px=float(x),
                 y_px=float(y),
                 confidence=float(confidence)
             )
-            detections.append(detection)
-        
-        return detections
+            for type_name, x, y, confidence in chain.from_iterable(per_template)
+        ]
 
 
 # Type alias for the detector
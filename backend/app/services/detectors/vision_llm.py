@@ -1,3 +1,5 @@
+import asyncio
+import contextlib
 import cv2, math, json, base64
 import numpy as np
 from typing import List, Tuple
@@ -70,14 +72,28 @@ class VisionLLMDetector:
         tiles = make_tiles(page_rgb, self.tile_px, self.overlap_px)
         results: List[Tuple[float,float,str,float]] = []
 
-        # sequential loop keeps payloads small and avoids rate spikes
-        for t in tiles:
-            b64 = encode_png_b64_capped(t["image"], 900_000)
-            resp = await self.llm.infer(b64, prompt, schema)
-            for d in resp.get("detections", []):
-                x_abs = t["x0"] + float(d["x_px"])
-                y_abs = t["y0"] + float(d["y_px"])
-                results.append((x_abs, y_abs, d["type"], float(d["confidence"])))
+        # sequential loop keeps payloads small and avoids rate spikes; the next tile's
+        # PNG encode runs in a worker thread while the current tile's request is in flight
+        def _encode(i: int) -> "asyncio.Task[str]":
+            return asyncio.create_task(asyncio.to_thread(encode_png_b64_capped, tiles[i]["image"], 900_000))
+
+        next_b64 = _encode(0) if tiles else None
+        try:
+            for i, t in enumerate(tiles):
+                b64 = await next_b64
+                next_b64 = _encode(i + 1) if i + 1 < len(tiles) else None
+                resp = await self.llm.infer(b64, prompt, schema)
+                for d in resp.get("detections", []):
+                    x_abs = t["x0"] + float(d["x_px"])
+                    y_abs = t["y0"] + float(d["y_px"])
+                    results.append((x_abs, y_abs, d["type"], float(d["confidence"])))
+        finally:
+            # a request failed mid-loop: drop the prefetched encode and retrieve its
+            # outcome so asyncio does not warn about a pending or unretrieved task
+            if next_b64 is not None:
+                next_b64.cancel()
+                with contextlib.suppress(asyncio.CancelledError, Exception):
+                    await next_b64
 
         merged = nms_merge(results, radius=24.0)
         # jsonify
@@ -170,7 +170,7 @@ def ingest_files(pid: str, files: List[UploadFile], job_id: str = None) -> Dict[
             try:
                 with open(file_path, "wb") as f:
                     # Read in chunks to handle large files efficiently
-                    chunk_size = 8192  # 8KB chunks
+                    chunk_size = 1024 * 1024  # 1 MB chunks
                     while chunk := file.file.read(chunk_size):
                         f.write(chunk)
                         content_hash.update(chunk)
@@ -410,7 +410,7 @@ def ingest_filepaths(pid: str, file_paths: List[str]) -> Dict[str, Any]:
             with open(file_path, "rb") as src_file:
                 with open(ingest_file_path, "wb") as dst_file:
                     # Read in chunks to handle large files efficiently
-                    chunk_size = 8192  # 8KB chunks
+                    chunk_size = 1024 * 1024  # 1 MB chunks
                     while chunk := src_file.read(chunk_size):
                         dst_file.write(chunk)
                         content_hash.update(chunk)
@@ -18,24 +18,26 @@ class ScaleInfo:
     units: str = "ft"
 
 
+# Scale text patterns in priority order, compiled once at import
+_SCALE_PATTERNS = tuple(re.compile(p, re.IGNORECASE) for p in (
+    r'1["\']?\s*=\s*(\d+)\s*["\']?',  # 1" = 50'
+    r'(\d+)\s*["\']?\s*=\s*(\d+)\s*["\']?',  # 50" = 100'
+    r'scale\s*:?\s*1["\']?\s*=\s*(\d+)',  # Scale: 1" = 50'
+    r'(\d+)\s*ft\s*per\s*inch',  # 50 ft per inch
+))
+
+
 def infer_scale_text(texts: List[Dict[str, Any]]) -> Optional[ScaleInfo]:
     """
     Infer scale from text elements containing scale information.
     """
-    scale_patterns = [
-        r'1["\']?\s*=\s*(\d+)\s*["\']?',  # 1" = 50'
-        r'(\d+)\s*["\']?\s*=\s*(\d+)\s*["\']?',  # 50" = 100'
-        r'scale\s*:?\s*1["\']?\s*=\s*(\d+)',  # Scale: 1" = 50'
-        r'(\d+)\s*ft\s*per\s*inch',  # 50 ft per inch
-    ]
-    
     for text_elem in texts:
         text = text_elem.get("text", "").strip()
         if not text:
             continue
             
-        for pattern in scale_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
+        for pattern in _SCALE_PATTERNS:
+            match = pattern.search(text)
             if match:
                 try:
                     if len(match.groups()) == 1:
@@ -4,6 +4,7 @@ import json
 import time
 import logging
 import asyncio
+import threading
 from pathlib import Path
 PROJECT_ROOT = Path(__file__).resolve().parents[3]
 
@@ -11,6 +12,11 @@ from typing import List, Dict, Any
 
 from fastapi import UploadFile, HTTPException
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 from ..models.schemas import TakeoffOutput, ScopeOutput, LevelingResult, RiskOutput, EstimateItem, EstimateOutput
 from ..agents import takeoff_agent, scope_agent, leveler_agent, risk_agent
@@ -35,6 +41,9 @@ def _safe_filename(name: str) -> str:
     return "".join(c for c in name if c.isalnum() or c in ("-", "_", ".", " ")).strip()
 
 def _read_json(path: Path):
+    # orjson parses straight from bytes, skipping the str decode; stdlib json is the fallback
+    if ORJSON_AVAILABLE:
+        return orjson.loads(path.read_bytes())
     return json.loads(path.read_text())
 
 def _latest_jsons(dirpath: Path) -> list[Path]:
@@ -56,16 +65,32 @@ def _gather_takeoff_items(project_dir: Path) -> list[dict]:
             continue
     return out
 
+# Parsed config files keyed by resolved path, stored with the mtime they were read at.
+_config_cache: dict[Path, tuple[int, Any]] = {}
+_config_cache_lock = threading.Lock()
+
+def _read_config_json(path: Path):
+    """Parse a config JSON file, re-reading only when its mtime changes; treat the result as read-only."""
+    key = path.resolve()
+    mtime_ns = key.stat().st_mtime_ns
+    with _config_cache_lock:
+        cached = _config_cache.get(key)
+        if cached is not None and cached[0] == mtime_ns:
+            return cached[1]
+        data = _read_json(key)
+        _config_cache[key] = (mtime_ns, data)
+        return data
+
 def _load_costbook() -> dict[str, float]:
     """Load costbook from COSTBOOK_PATH or fallback to backend/app/data/costbook.json."""
     env_path = os.getenv("COSTBOOK_PATH")
     if env_path:
         p = Path(env_path)
         if p.exists():
-            return _read_json(p)
+            return _read_config_json(p)
     fallback = PROJECT_ROOT / "backend" / "app" / "data" / "costbook.json"
     if fallback.exists():
-        return _read_json(fallback)
+        return _read_config_json(fallback)
     return {}
 
 
@@ -122,12 +147,14 @@ async def ingest(pid: str, file: UploadFile):
 
     # Stream upload to disk (handles large PDFs)
     CHUNK = 1024 * 1024  # 1 MB
+    size_bytes = 0
     with target.open("wb") as out:
         while True:
             chunk = await file.read(CHUNK)
             if not chunk:
                 break
             out.write(chunk)
+            size_bytes += len(chunk)
 
     from ..workers.indexer import write_sheet_index  # import
     from ..workers.spec_indexer import write_spec_index
@@ -144,7 +171,7 @@ async def ingest(pid: str, file: UploadFile):
     # Compute file hash for deduplication
     content_hash = hashlib.sha256()
     with open(target, "rb") as f:
-        for chunk in iter(lambda: f.read(8192), b""):
+        for chunk in iter(lambda: f.read(CHUNK), b""):
             content_hash.update(chunk)
     final_hash = content_hash.hexdigest()
     
@@ -153,7 +180,7 @@ async def ingest(pid: str, file: UploadFile):
     manifest_item = {
         "filename": file.filename,
         "content_hash": final_hash,
-        "size": target.stat().st_size,
+        "size": size_bytes,
         "indexed_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
         "source_type": "upload",
         "status": "indexed",
@@ -171,7 +198,7 @@ async def ingest(pid: str, file: UploadFile):
         'status': 200,
         'result': {
             'filename': file.filename,
-            'bytes': target.stat().st_size,
+            'bytes': size_bytes,
             'content_type': file.content_type
         }
     })
@@ -184,7 +211,7 @@ async def ingest(pid: str, file: UploadFile):
         "geometry_index_path": str(geom_path),
         "original_filename": file.filename,
         "content_type": file.content_type,
-        "bytes": target.stat().st_size,
+        "bytes": size_bytes,
         "status": "saved",
     }
 
@@ -287,6 +314,8 @@ async def run_estimate(pid: str) -> EstimateOutput:
 
     takeoff_items = _gather_takeoff_items(proj_dir)
     costbook = _load_costbook()
+    # bind the assembly -> cost table once rather than re-dereferencing it per item
+    costs = costbook.get("costs", {})
 
     overhead_pct = float(os.getenv("OVERHEAD_PCT", "10"))
     profit_pct  = float(os.getenv("PROFIT_PCT",  "5"))
@@ -304,8 +333,8 @@ async def run_estimate(pid: str) -> EstimateOutput:
         unit_cost = 0.0
         description = assembly_id  # Default description
         
-        if assembly_id and "costs" in costbook:
-            cost_entry = costbook["costs"].get(assembly_id)
+        if assembly_id:
+            cost_entry = costs.get(assembly_id)
             if cost_entry:
                 unit_cost = float(cost_entry.get("unit_cost", 0.0))
                 description = cost_entry.get("description", assembly_id)
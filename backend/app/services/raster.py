@@ -119,6 +119,23 @@ def px_to_pdf(x_px: float, y_px: float, meta: Dict) -> Tuple[float, float]:
     return x_pdf, y_pdf
 
 
+def px_to_pdf_batch(xs: np.ndarray, ys: np.ndarray, meta: Dict) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Vectorised px_to_pdf: convert arrays of pixel coordinates in one pass.
+    
+    Args:
+        xs: X coordinates in pixels
+        ys: Y coordinates in pixels
+        meta: Metadata dictionary from render_pdf_page
+        
+    Returns:
+        Tuple of (x_pdf, y_pdf) float64 arrays in PDF points
+    """
+    x_pdf = np.asarray(xs, dtype=np.float64) * meta["scale_x_pts_per_px"]
+    y_pdf = np.asarray(ys, dtype=np.float64) * meta["scale_y_pts_per_px"]
+    return x_pdf, y_pdf
+
+
 def pdf_to_px(x_pdf: float, y_pdf: float, meta: Dict) -> Tuple[float, float]:
     """
     Convert PDF coordinates to pixel coordinates.
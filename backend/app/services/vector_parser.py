@@ -44,14 +44,18 @@ def calculate_polygon_area(points: List[Tuple[float, float]]) -> float:
     return abs(area) / 2.0
 
 
+# 1" = 20' style and 1:240 style scale notes
+_SCALE_FEET_PER_INCH_RE = re.compile(r'1["\']?\s*=\s*(\d+)[\'"]?', re.IGNORECASE)
+_SCALE_RATIO_RE = re.compile(r'1\s*:\s*(\d+)', re.IGNORECASE)
+
+
 def parse_scale_from_text(text: str) -> Optional[Dict[str, Any]]:
     """
     Parse scale information from text like '1\" = 20\'' or 'Scale: 1:240'.
     Returns dict with scale_factor (PDF units to real-world feet).
     """
     # Pattern: 1" = 20' or similar
-    pattern1 = r'1["\']?\s*=\s*(\d+)[\'"]?'
-    match = re.search(pattern1, text, re.IGNORECASE)
+    match = _SCALE_FEET_PER_INCH_RE.search(text)
     if match:
         feet_per_inch = float(match.group(1))
         # Assume 72 PDF points = 1 inch
@@ -64,8 +68,7 @@ def parse_scale_from_text(text: str) -> Optional[Dict[str, Any]]:
         }
     
     # Pattern: 1:240 (1 inch = 20 feet = 240 inches)
-    pattern2 = r'1\s*:\s*(\d+)'
-    match = re.search(pattern2, text, re.IGNORECASE)
+    match = _SCALE_RATIO_RE.search(text)
     if match:
         ratio = float(match.group(1))
         feet_per_inch = ratio / 12.0
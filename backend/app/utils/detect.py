@@ -1,6 +1,5 @@
 """Detection utilities for count items."""
 import os
-import tempfile
 import uuid
 from typing import List, Dict, Any, Tuple, Optional
 import fitz  # PyMuPDF
@@ -124,19 +123,16 @@ def detect_count_items(
         page = doc[page_num]
         page_rect = page.rect
         
-        # Render page to PNG at 300 DPI
+        # Render page at 300 DPI and hand the pixel buffer straight to OpenCV;
+        # no PNG encode/decode round-trip through a temporary file
         matrix = fitz.Matrix(300/72, 300/72)  # 300 DPI
-        pix = page.get_pixmap(matrix=matrix)
-        
-        # Save to temporary file
-        with tempfile.NamedTemporaryFile(suffix='.png', delete=False) as temp_file:
-            pix.save(temp_file.name)
-            temp_path = temp_file.name
-        
-        # Load image with OpenCV
-        image = cv2.imread(temp_path, cv2.IMREAD_GRAYSCALE)
-        if image is None:
-            raise ValueError("Failed to load rendered image")
+        pix = page.get_pixmap(matrix=matrix, colorspace=fitz.csRGB, alpha=False)
+        rgb = (
+            np.frombuffer(pix.samples, dtype=np.uint8)
+              .reshape(pix.h, pix.stride)[:, :pix.w * pix.n]
+              .reshape(pix.h, pix.w, pix.n)
+        )
+        image = cv2.cvtColor(rgb, cv2.COLOR_RGB2GRAY)
         
         image_height, image_width = image.shape
         
@@ -174,8 +170,6 @@ def detect_count_items(
             # Update totals
             result.totals[detection["type"]] = result.totals.get(detection["type"], 0) + 1
         
-        # Clean up temporary file
-        os.unlink(temp_path)
         doc.close()
         
     except Exception as e:
@@ -1,3 +1,5 @@
+import os
+import tempfile
 from pathlib import Path
 import json, pdfplumber
 from ..core.paths import artifacts_root, project_dir, stage_dir
@@ -35,6 +37,21 @@ def write_sheet_index(pid: str) -> Path:
                        "discipline": "Architectural", "title": "Stub"}]
     idx = {"project_id": pid, "sheets": sheets_all}
     path = proj / "sheet_index.json"
-    path.write_text(json.dumps(idx, indent=2))
+    data = json.dumps(idx, indent=2).encode("utf-8")
+    try:
+        unchanged = path.read_bytes() == data
+    except FileNotFoundError:
+        unchanged = False
+    if not unchanged:
+        # write-then-rename so readers never observe a partially written index;
+        # a unique temp name keeps overlapping index runs from clobbering each other
+        fd, tmp_name = tempfile.mkstemp(dir=proj, suffix=".json.tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp_name, path)
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
     return path
 
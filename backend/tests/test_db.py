@@ -9,7 +9,8 @@ from unittest.mock import patch
 
 from backend.app.services.db import (
     get_conn, create_job, update_job, get_job, 
-    list_jobs, delete_job, get_job_count
+    list_jobs, delete_job, get_job_count,
+    create_jobs_bulk, update_jobs_bulk, checkpoint_wal
 )
 
 
@@ -20,7 +21,7 @@ def temp_db():
         db_path = tmp.name
     
     # Mock the artifacts directory to use our temp file
-    with patch('app.services.db.jobs_db_path') as mock_path:
+    with patch('backend.app.services.db.jobs_db_path') as mock_path:
         mock_path.return_value = Path(db_path)
         
         # Create the database and tables
@@ -35,7 +36,7 @@ def temp_db():
 
 def test_create_job(temp_db):
     """Test creating a new job."""
-    with patch('app.services.db.jobs_db_path') as mock_path:
+    with patch('backend.app.services.db.jobs_db_path') as mock_path:
         mock_path.return_value = Path(temp_db)
         
         create_job("test-job-1", "test-project", "queued", "2025-01-01T00:00:00Z")
@@ -52,7 +53,7 @@ def test_create_job(temp_db):
 
 def test_update_job(temp_db):
     """Test updating an existing job."""
-    with patch('app.services.db.jobs_db_path') as mock_path:
+    with patch('backend.app.services.db.jobs_db_path') as mock_path:
         mock_path.return_value = Path(temp_db)
         
         # Create a job first
@@ -78,7 +79,7 @@ def test_update_job(temp_db):
 
 def test_get_job_not_found(temp_db):
     """Test getting a non-existent job."""
-    with patch('app.services.db.jobs_db_path') as mock_path:
+    with patch('backend.app.services.db.jobs_db_path') as mock_path:
         mock_path.return_value = Path(temp_db)
         
         job = get_job("non-existent-job")
@@ -87,7 +88,7 @@ def test_get_job_not_found(temp_db):
 
 def test_list_jobs(temp_db):
     """Test listing jobs."""
-    with patch('app.services.db.jobs_db_path') as mock_path:
+    with patch('backend.app.services.db.jobs_db_path') as mock_path:
         mock_path.return_value = Path(temp_db)
         
         # Create multiple jobs
@@ -105,9 +106,31 @@ def test_list_jobs(temp_db):
         assert all(job['pid'] == "project-A" for job in project_a_jobs)
 
 
+def test_list_jobs_without_result_and_paginated(temp_db):
+    """Test listing jobs without result payloads, with limit/offset."""
+    with patch('backend.app.services.db.jobs_db_path') as mock_path:
+        mock_path.return_value = Path(temp_db)
+        
+        create_job("job-1", "project-A", "queued", "2025-01-01T00:00:00Z")
+        create_job("job-2", "project-A", "running", "2025-01-01T01:00:00Z")
+        create_job("job-3", "project-A", "completed", "2025-01-01T02:00:00Z")
+        update_job("job-3", "completed", "2025-01-01T03:00:00Z", result_json='{"ok": true}')
+        
+        jobs = list_jobs("project-A", include_result=False)
+        assert [job['id'] for job in jobs] == ["job-3", "job-2", "job-1"]
+        assert all('result' not in job and 'result_json' not in job for job in jobs)
+        
+        page = list_jobs("project-A", limit=2, offset=1)
+        assert [job['id'] for job in page] == ["job-2", "job-1"]
+        assert list_jobs("project-A", limit=1)[0]['result'] == {"ok": True}
+        
+        # offset without limit skips rows instead of being ignored
+        assert [job['id'] for job in list_jobs("project-A", offset=2)] == ["job-1"]
+
+
 def test_delete_job(temp_db):
     """Test deleting a job."""
-    with patch('app.services.db.jobs_db_path') as mock_path:
+    with patch('backend.app.services.db.jobs_db_path') as mock_path:
         mock_path.return_value = Path(temp_db)
         
         # Create a job
@@ -130,7 +153,7 @@ def test_delete_job(temp_db):
 
 def test_get_job_count(temp_db):
     """Test getting job counts."""
-    with patch('app.services.db.jobs_db_path') as mock_path:
+    with patch('backend.app.services.db.jobs_db_path') as mock_path:
         mock_path.return_value = Path(temp_db)
         
         # Initially no jobs
@@ -150,7 +173,7 @@ def test_get_job_count(temp_db):
 
 def test_database_connection_configuration(temp_db):
     """Test that database connection is properly configured."""
-    with patch('app.services.db.jobs_db_path') as mock_path:
+    with patch('backend.app.services.db.jobs_db_path') as mock_path:
         mock_path.return_value = Path(temp_db)
         
         conn = get_conn()
@@ -170,12 +193,16 @@ def test_database_connection_configuration(temp_db):
         foreign_keys = cursor.fetchone()[0]
         assert foreign_keys == 1
         
+        # Check WAL checkpoint and busy timeout tuning
+        assert conn.execute("PRAGMA wal_autocheckpoint").fetchone()[0] == 10000
+        assert conn.execute("PRAGMA busy_timeout").fetchone()[0] == 5000
+        
         conn.close()
 
 
 def test_job_with_error(temp_db):
     """Test job with error text."""
-    with patch('app.services.db.jobs_db_path') as mock_path:
+    with patch('backend.app.services.db.jobs_db_path') as mock_path:
         mock_path.return_value = Path(temp_db)
         
         create_job("error-job", "test-project", "failed", "2025-01-01T00:00:00Z")
@@ -193,3 +220,45 @@ def test_job_with_error(temp_db):
         assert job['status'] == "failed"
         assert job['error_text'] == "Something went wrong during processing"
         assert job['result'] is None
+
+
+def test_bulk_create_and_update(temp_db):
+    """Test creating and updating many jobs in one transaction."""
+    with patch('backend.app.services.db.jobs_db_path') as mock_path:
+        mock_path.return_value = Path(temp_db)
+        
+        created = create_jobs_bulk([
+            ("bulk-1", "project-A", "queued", "2025-01-01T00:00:00Z"),
+            ("bulk-2", "project-A", "queued", "2025-01-01T00:00:01Z"),
+            ("bulk-3", "project-B", "queued", "2025-01-01T00:00:02Z"),
+        ])
+        assert created == 3
+        assert get_job_count("project-A") == 2
+        
+        updated = update_jobs_bulk([
+            ("bulk-1", "completed", "2025-01-01T01:00:00Z", '{"ok": true}', None),
+            ("bulk-2", "failed", "2025-01-01T01:00:00Z", None, "boom"),
+            ("missing", "completed", "2025-01-01T01:00:00Z", None, None),
+        ])
+        assert updated == 2
+        
+        job = get_job("bulk-1")
+        assert job['status'] == "completed"
+        assert job['created_at'] == "2025-01-01T00:00:00Z"
+        assert job['result'] == {"ok": True}
+        assert get_job("bulk-2")['error_text'] == "boom"
+        assert get_job("bulk-3")['status'] == "queued"
+
+
+def test_checkpoint_wal(temp_db):
+    """Test that an explicit checkpoint empties the WAL."""
+    with patch('backend.app.services.db.jobs_db_path') as mock_path:
+        mock_path.return_value = Path(temp_db)
+        
+        create_job("ckpt-1", "project-A", "queued", "2025-01-01T00:00:00Z")
+        
+        busy, wal_pages, checkpointed = checkpoint_wal()
+        assert busy == 0
+        assert wal_pages == checkpointed
+        assert os.path.getsize(temp_db + "-wal") == 0
+        assert get_job("ckpt-1")['status'] == "queued"
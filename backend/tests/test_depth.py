@@ -7,7 +7,7 @@ import json
 from pathlib import Path
 from backend.app.services.detectors.depth import (
     init_depth_config, od_ft, sample_depth_along_run, summarize_depth,
-    DepthSample, DepthSummary
+    sample_depth_arrays, DepthSample, DepthSamples, DepthSummary
 )
 
 
@@ -204,3 +204,42 @@ def test_trench_area_calculation():
         
         # Trench width should be reasonable
         assert sample.trench_width_ft > 0.5  # At least pipe OD + clearance
+
+
+def test_sample_depth_arrays_matches_list():
+    """Test the array sampler agrees with the DepthSample list API."""
+    s_profile = [(0.0, 100.0), (0.5, 99.5), (1.0, 97.0)]
+    
+    def ground_at_s(station):
+        return 104.0 - (station * 2.0)
+    
+    arrays = sample_depth_arrays(s_profile, ground_at_s, "pvc", 8.0, n_samples=11)
+    samples = sample_depth_along_run(s_profile, ground_at_s, "pvc", 8.0, n_samples=11)
+    
+    assert isinstance(arrays, DepthSamples)
+    assert len(arrays) == 11
+    assert arrays.to_list() == samples
+    assert summarize_depth(arrays, "storm") == summarize_depth(samples, "storm")
+
+
+def test_init_depth_config_reloads_changed_file():
+    """Test repeated init reuses parsed config but picks up edits."""
+    import os
+    
+    with tempfile.TemporaryDirectory() as temp_dir:
+        config_dir = Path(temp_dir) / "pipes"
+        config_dir.mkdir()
+        od_file = config_dir / "od_lookup.json"
+        
+        with open(od_file, 'w') as f:
+            json.dump({"pvc": {"8": 8.625}}, f)
+        init_depth_config(temp_dir)
+        init_depth_config(temp_dir)
+        assert abs(od_ft("pvc", 8.0) - (8.625 / 12.0)) < 0.001
+        
+        with open(od_file, 'w') as f:
+            json.dump({"pvc": {"8": 9.0}}, f)
+        stat = od_file.stat()
+        os.utime(od_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        init_depth_config(temp_dir)
+        assert abs(od_ft("pvc", 8.0) - (9.0 / 12.0)) < 0.001
@@ -1,12 +1,12 @@
 from __future__ import annotations
 from pathlib import Path
+from .geom import line_bounds
 
 def export_svg(px, out_path: str):
-    xs = [p for ln in px.lines for p in (ln.p1[0], ln.p2[0])]
-    ys = [p for ln in px.lines for p in (ln.p1[1], ln.p2[1])]
-    if not xs or not ys:
+    bounds = line_bounds(px.lines)
+    if bounds is None:
         Path(out_path).write_text("<svg/>"); return
-    minx, maxx, miny, maxy = min(xs), max(xs), min(ys), max(ys)
+    minx, miny, maxx, maxy = bounds
     w, h = maxx-minx+20, maxy-miny+20
     lines = []
     for ln in px.lines:
@@ -1,5 +1,5 @@
 from __future__ import annotations
-from typing import List
+from typing import List, Optional, Sequence, Tuple
 import numpy as np
 from shapely.geometry import LineString
 from shapely.ops import linemerge, unary_union
@@ -23,3 +23,11 @@ def merge_lines(lines: List[LineString]) -> List[LineString]:
         return [merged]
     return list(merged.geoms)
 
+def line_bounds(lines: Sequence) -> Optional[Tuple[float, float, float, float]]:
+    """(minx, miny, maxx, maxy) over all line endpoints in one array sweep, or None if empty."""
+    if not lines:
+        return None
+    pts = np.array([(ln.p1, ln.p2) for ln in lines], dtype=float).reshape(-1, 2)
+    minx, miny = pts.min(axis=0).tolist()
+    maxx, maxy = pts.max(axis=0).tolist()
+    return minx, miny, maxx, maxy
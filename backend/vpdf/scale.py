@@ -1,9 +1,11 @@
 from __future__ import annotations
 from typing import Optional, Tuple
-import math, re
+import heapq, math, re
 from .extract import PageDraw
+from .geom import line_bounds
 
 BLACK = (0.0, 0.0, 0.0)
+_FT_LABEL_RE = re.compile(r"(\d+(?:\.\d+)?)\s*ft\b")
 
 def _color_close(c, t, tol=30/255.0):
     return c and all(abs(ci - ti) <= tol for ci, ti in zip(c, t))
@@ -24,18 +26,20 @@ def detect_scale_bar_ft_per_unit(px: PageDraw,
     if scale_spans:
         scale_spans.sort(key=lambda s: (s.bbox[1], s.bbox[0]))  # lowest/leftmost
         anchor_xy = _center(scale_spans[0].bbox)
-        nearby = sorted(px.texts, key=lambda s: (_center(s.bbox)[0]-anchor_xy[0])**2 + (_center(s.bbox)[1]-anchor_xy[1])**2)[:12]
+        ax, ay = anchor_xy
+        # 12 closest labels by squared distance; nsmallest keeps sorted()[:12] order without a full sort
+        def _dist2(s):
+            cx, cy = _center(s.bbox)
+            return (cx - ax)**2 + (cy - ay)**2
+        nearby = heapq.nsmallest(12, px.texts, key=_dist2)
         for s in nearby:
-            m = re.search(r"(\d+(?:\.\d+)?)\s*ft\b", s.text.lower())
+            m = _FT_LABEL_RE.search(s.text.lower())
             if m:
                 ft_label = float(m.group(1)); break
 
     # 2) Prefer bottom-left quadrant (legend region)
     if px.lines:
-        xs = [p for ln in px.lines for p in (ln.p1[0], ln.p2[0])]
-        ys = [p for ln in px.lines for p in (ln.p1[1], ln.p2[1])]
-        x_min, x_max = min(xs), max(xs)
-        y_min, y_max = min(ys), max(ys)
+        x_min, y_min, x_max, y_max = line_bounds(px.lines)
         region = (x_min, y_min, x_min + 0.5*(x_max-x_min), y_min + 0.5*(y_max-y_min))
     else:
         region = None
@@ -8,11 +8,12 @@ and creates/updates the ingest manifest for immediate testing.
 
 import os
 import sys
+import json
 import shutil
 import hashlib
 from datetime import datetime
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Set
 
 # Add backend to path for imports
 backend_dir = Path(__file__).parent.parent / "backend"
@@ -22,50 +23,76 @@ from app.core.config import get_settings
 from app.core.paths import project_ingest_raw_dir, project_ingest_manifest
 
 
+def _seeded_hashes(demo_pid: str) -> Set[str]:
+    """Content hashes already recorded in the demo project's ingest manifest."""
+    manifest_path = project_ingest_manifest(demo_pid)
+    try:
+        with open(manifest_path, 'r') as f:
+            manifest = json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError, IOError):
+        return set()
+    return {item.get("content_hash") for item in manifest.get("items", [])}
+
+
 def copy_sample_files(demo_pid: str = "demo") -> List[Dict[str, Any]]:
     """
     Copy sample files to demo project's ingest raw directory.
     
+    Samples whose content is already in the manifest are skipped, so
+    re-running the seed only touches new samples.
+    
     Args:
         demo_pid: Project ID for demo (default: "demo")
         
     Returns:
         List of manifest items for copied files
+        
+    Raises:
+        FileNotFoundError: If there are no sample files to seed
     """
     # Get paths
     samples_dir = backend_dir / "static" / "samples"
     raw_dir = project_ingest_raw_dir(demo_pid)
     
-    # Ensure raw directory exists
-    raw_dir.mkdir(parents=True, exist_ok=True)
-    
-    # Get sample files
-    sample_files = []
-    if samples_dir.exists():
-        for file_path in samples_dir.iterdir():
-            if file_path.is_file() and not file_path.name.startswith('.'):
-                sample_files.append(file_path)
+    # Get sample files (single directory read)
+    try:
+        with os.scandir(samples_dir) as it:
+            sample_files = [
+                Path(e.path) for e in it
+                if e.is_file() and not e.name.startswith('.')
+            ]
+    except FileNotFoundError:
+        sample_files = []
     
     if not sample_files:
-        print(f"⚠️  No sample files found in {samples_dir}")
-        return []
+        raise FileNotFoundError(f"No sample files found in {samples_dir}")
+    
+    seeded = _seeded_hashes(demo_pid)
+    
+    # Ensure raw directory exists
+    raw_dir.mkdir(parents=True, exist_ok=True)
     
     # Copy files with timestamped names
     manifest_items = []
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     
     for i, sample_file in enumerate(sample_files):
+        # Size and hash come from a single read of the sample
+        data = sample_file.read_bytes()
+        file_size = len(data)
+        content_hash = hashlib.sha256(data).hexdigest()
+        
+        if content_hash in seeded:
+            print(f"⏭️  Skipped {sample_file.name} (already seeded)")
+            continue
+        
         # Create timestamped filename
         timestamped_name = f"{timestamp}_{i+1:02d}_{sample_file.name}"
         dest_path = raw_dir / timestamped_name
         
-        # Copy file
-        shutil.copy2(sample_file, dest_path)
-        
-        # Calculate file size and hash
-        file_size = dest_path.stat().st_size
-        with open(dest_path, 'rb') as f:
-            content_hash = hashlib.sha256(f.read()).hexdigest()
+        # Copy file contents we already hold, then carry over metadata
+        dest_path.write_bytes(data)
+        shutil.copystat(sample_file, dest_path)
         
         # Create manifest item
         manifest_item = {
@@ -98,7 +125,6 @@ def update_manifest(demo_pid: str, manifest_items: List[Dict[str, Any]]) -> None
     
     # Load existing manifest or create new one
     if manifest_path.exists():
-        import json
         try:
             with open(manifest_path, 'r') as f:
                 manifest = json.load(f)
@@ -153,8 +179,8 @@ def main():
         manifest_items = copy_sample_files(demo_pid)
         
         if not manifest_items:
-            print("❌ No files were copied. Exiting.")
-            sys.exit(1)
+            print("✅ All samples already seeded; nothing to do.")
+            return
         
         # Update manifest
         print(f"\n📝 Updating ingest manifest...")